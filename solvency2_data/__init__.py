@@ -4,6 +4,6 @@
 
 from .rfr import *
 from .eiopa_data import get, refresh
-from .util import set_config
+from .util import set_config, LRUCache
 from .smith_wilson import *
 from .alternative_extrapolation import *
@@ -1,3 +1,8 @@
+import logging
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 from collections import OrderedDict
@@ -7,6 +12,43 @@ MAX_ERROR = 0.0000000001
 MAX_RUNS = 20
 
 
+def _weighted_taylor(f, n):
+    """Taylor expansion in f of the sum of i / (1+f)^(i+1) for i = 1 to n"""
+    return (
+        n * (n + 1) / 2
+        - n * (n + 1) * (n + 2) / 3 * f
+        + n * (n + 1) * (n + 2) * (n + 3) / 8 * f**2
+    )
+
+
+def _annuity_sums(f, n):
+    """
+    Closed forms of the sum of x^i and the sum of i * x^(i+1) for i = 1 to
+    n, with x = 1/(1+f), which is minus the derivative of the first sum to
+    f, and of x^n. For small f the closed forms cancel, so the limit and the
+    Taylor expansion in f are used there, and expm1 and log1p are only used
+    where 1+f is positive.
+    """
+    if not isinstance(f, np.ndarray) and not isinstance(n, np.ndarray):
+        x_n = (1 + f) ** -n
+        expm1 = math.expm1(-n * math.log1p(f)) if f > -1 else x_n - 1
+        if abs(n * f) < 1e-4:
+            return (n if f == 0 else -expm1 / f), _weighted_taylor(f, n), x_n
+        return -expm1 / f, -(n * x_n / (1 + f) * f + expm1) / f**2, x_n
+    f = np.asarray(f, dtype="float64")
+    n = np.asarray(n, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_n = (1 + f) ** -n
+        expm1 = np.where(f > -1, np.expm1(-n * np.log1p(f)), x_n - 1)
+        annuity = np.where(f == 0, n, -expm1 / f)
+        weighted = np.where(
+            np.abs(n * f) < 1e-4,
+            _weighted_taylor(f, n),
+            -(n * x_n / (1 + f) * f + expm1) / f**2,
+        )
+    return annuity, weighted, x_n
+
+
 def DiscountedValue4par2forwards(
     sum_df: float = 0,
     last_df: float = 0,
@@ -17,6 +59,10 @@ def DiscountedValue4par2forwards(
     """
     Calculates the discounted value for two-factor parallel forwards.
 
+    The discounted value and its derivative to the forward rate contain
+    geometric series in 1/(1+forward_rate), which are evaluated in closed
+    form, so the arguments can also be numpy arrays.
+
     Args:
         sum_df (float, optional): The sum of discount factors. Defaults to 0.
         last_df (float, optional): The last discount factor. Defaults to 0.
@@ -27,13 +73,10 @@ def DiscountedValue4par2forwards(
     Returns:
         float: The calculated discounted value.
     """
-    disc_val_1 = sum_df * par_rate
-    disc_val_2 = 0
-    for i in range(1, t_min_k + 1):
-        disc_val_1 += par_rate * last_df / ((1 + forward_rate) ** i)
-        disc_val_2 -= i * par_rate * last_df / ((1 + forward_rate) ** (i + 1))
-    disc_val_1 += last_df / ((1 + forward_rate) ** t_min_k) - 1
-    disc_val_2 -= t_min_k * last_df / ((1 + forward_rate) ** (t_min_k + 1))
+    annuity, weighted, x_n = _annuity_sums(forward_rate, t_min_k)
+    x = 1 / (1 + forward_rate)
+    disc_val_1 = sum_df * par_rate + par_rate * last_df * annuity + last_df * x_n - 1
+    disc_val_2 = -par_rate * last_df * weighted - t_min_k * last_df * x_n * x
     return disc_val_1, disc_val_2
 
 
@@ -42,25 +85,35 @@ def FromParToForwards(
     span: int = 120,
     max_runs: int = MAX_RUNS,
     max_error: float = MAX_ERROR,
+    diagnostics: bool = False,
 ):
     """
     Converts a par rate term structure to forward rates.
 
+    A warning is logged for each maturity for which the Newton iterations
+    did not converge within max_runs iterations.
+
     Args:
         term_struct (pd.Series, optional): The par rate term structure. Defaults to None.
         span (int, optional): The span of the forward rates. Defaults to 120.
         max_runs (int, optional): The maximum number of iterations for convergence. Defaults to MAX_RUNS.
         max_error (float, optional): The maximum error for convergence. Defaults to MAX_ERROR.
+        diagnostics (bool, optional): Also return the convergence diagnostics.
+            Defaults to False.
 
     Returns:
-        pd.Series: The forward rates term structure.
+        pd.Series: The forward rates term structure. With diagnostics a tuple
+            of the forward rates and a pd.DataFrame indexed by maturity with
+            the columns iterations, residual, converged and time (seconds).
     """
     forwards_struct = np.zeros(span)
 
     sum_df = 0
     df = 1
     previous_maturity = 0
+    runs = []
     for maturity in term_struct.keys():
+        start = time.perf_counter()
         f = 0
         t_min_k = maturity - previous_maturity
         disc_val_1, disc_val_2 = DiscountedValue4par2forwards(
@@ -73,6 +126,15 @@ def FromParToForwards(
                 sum_df, df, term_struct[maturity], f, t_min_k
             )
             k = k + 1
+        converged = np.abs(disc_val_1) < max_error
+        if not converged:
+            logging.warning(
+                "No convergence for maturity %s after %s iterations, residual %s",
+                maturity,
+                k,
+                disc_val_1,
+            )
+        runs.append((k, np.abs(disc_val_1), converged, time.perf_counter() - start))
         for i in range(previous_maturity + 1, maturity + 1):
             forwards_struct[i - 1] = f
             df /= 1 + forwards_struct[i - 1]
@@ -82,7 +144,132 @@ def FromParToForwards(
     for i in range(term_struct.keys()[-1], span + 1):
         forwards_struct[i - 1] = forwards_struct[i - 2]
 
-    return pd.Series(data=forwards_struct, index=range(1, span + 1), dtype="float64")
+    forwards = pd.Series(
+        data=forwards_struct, index=range(1, span + 1), dtype="float64"
+    )
+    if diagnostics:
+        return forwards, pd.DataFrame(
+            data=runs,
+            index=pd.Index(term_struct.keys(), name="maturity"),
+            columns=["iterations", "residual", "converged", "time"],
+        )
+    return forwards
+
+
+def FromParToForwardsBatch(
+    term_structs=None,
+    maturities: list = None,
+    span: int = 120,
+    max_runs: int = MAX_RUNS,
+    max_error: float = MAX_ERROR,
+    diagnostics: bool = False,
+):
+    """
+    Converts a batch of par rate term structures to forward rates.
+
+    The Newton iterations of FromParToForwards are run for all curves at
+    once, maturity by maturity, where curves that have converged are
+    masked out. Par rates that are NaN are not part of that curve, so
+    curves can have different maturities.
+
+    Args:
+        term_structs (pd.DataFrame or np.array): Par rates with shape
+            (curves, maturities), with the maturities as columns of a DataFrame.
+        maturities (list, optional): The maturities of the columns of an
+            array. Defaults to None, which means the columns of the DataFrame.
+        span (int, optional): The span of the forward rates. Defaults to 120.
+        max_runs (int, optional): The maximum number of iterations for convergence. Defaults to MAX_RUNS.
+        max_error (float, optional): The maximum error for convergence. Defaults to MAX_ERROR.
+        diagnostics (bool, optional): Also return the convergence diagnostics.
+            Defaults to False.
+
+    Returns:
+        pd.DataFrame or np.array: The forward rates with shape (curves, span),
+            a DataFrame with columns 1 to span if term_structs is a DataFrame.
+            With diagnostics a tuple of the forward rates and a dict with
+            the iterations, residual and converged per curve and maturity as
+            pd.DataFrame (NaN where the par rate is NaN) and the time
+            (seconds) per maturity as pd.Series.
+
+    Example:
+        >>> par = np.array([[0.01, 0.015, 0.02], [0.02, np.nan, 0.025]])
+        >>> FromParToForwardsBatch(par, [1, 5, 10], span=12).round(5)
+        array([[0.01   , 0.0163 , 0.0163 , 0.0163 , 0.0163 , 0.02557, 0.02557,
+                0.02557, 0.02557, 0.02557, 0.02557, 0.02557],
+               [0.02   , 0.02563, 0.02563, 0.02563, 0.02563, 0.02563, 0.02563,
+                0.02563, 0.02563, 0.02563, 0.02563, 0.02563]])
+    """
+    if maturities is None:
+        maturities = list(term_structs.columns)
+    rates = np.atleast_2d(np.asarray(term_structs, dtype="float64"))
+    n_curves = rates.shape[0]
+    forwards = np.zeros((n_curves, span))
+    years = np.arange(1, span + 1)
+
+    sum_df = np.zeros(n_curves)
+    df = np.ones(n_curves)
+    previous_maturity = np.zeros(n_curves, dtype=int)
+    iterations = np.full(rates.shape, np.nan)
+    residual = np.full(rates.shape, np.nan)
+    timing = np.zeros(len(maturities))
+    for col, maturity in enumerate(maturities):
+        start = time.perf_counter()
+        valid = ~np.isnan(rates[:, col])
+        par_rate = np.where(valid, rates[:, col], 0)
+        t_min_k = maturity - previous_maturity
+        f = np.zeros(n_curves)
+        disc_val_1, disc_val_2 = DiscountedValue4par2forwards(
+            sum_df, df, par_rate, f, t_min_k
+        )
+        active = valid & (np.abs(disc_val_1) >= max_error)
+        runs = np.zeros(n_curves)
+        k = 0
+        while np.any(active) and k <= max_runs:
+            f = np.where(active, f - disc_val_1 / disc_val_2, f)
+            disc_val_1, disc_val_2 = DiscountedValue4par2forwards(
+                sum_df, df, par_rate, f, t_min_k
+            )
+            runs += active
+            active &= np.abs(disc_val_1) >= max_error
+            k = k + 1
+        if np.any(active):
+            logging.warning(
+                "No convergence for maturity %s of %s curves after %s iterations",
+                maturity,
+                np.sum(active),
+                k,
+            )
+        iterations[valid, col] = runs[valid]
+        residual[valid, col] = np.abs(disc_val_1[valid])
+        # the forward rate applies from the previous maturity to this one
+        between = (years > previous_maturity[:, None]) & (years <= maturity)
+        forwards = np.where(valid[:, None] & between, f[:, None], forwards)
+        annuity, _, x_n = _annuity_sums(f, t_min_k)
+        sum_df = np.where(valid, sum_df + df * annuity, sum_df)
+        df = np.where(valid, df * x_n, df)
+        previous_maturity = np.where(valid, maturity, previous_maturity)
+        timing[col] = time.perf_counter() - start
+
+    # the last forward rate before the last maturity is used after it
+    last = np.take_along_axis(forwards, (previous_maturity[:, None] - 2) % span, 1)
+    forwards = np.where(years >= previous_maturity[:, None], last, forwards)
+
+    index = term_structs.index if isinstance(term_structs, pd.DataFrame) else None
+    if isinstance(term_structs, pd.DataFrame):
+        forwards = pd.DataFrame(data=forwards, index=index, columns=range(1, span + 1))
+    if diagnostics:
+        columns = pd.Index(maturities, name="maturity")
+        return forwards, {
+            "iterations": pd.DataFrame(iterations, index=index, columns=columns),
+            "residual": pd.DataFrame(residual, index=index, columns=columns),
+            "converged": pd.DataFrame(
+                np.where(np.isnan(rates), np.nan, residual < max_error),
+                index=index,
+                columns=columns,
+            ),
+            "time": pd.Series(timing, index=columns),
+        }
+    return forwards
 
 
 def create_swap_struct(
@@ -111,6 +298,190 @@ def create_swap_struct(
     )
 
 
+def create_swap_struct_batch(
+    rfr=None,
+    additional_swaps: dict = {},
+    cra=CRA,
+    max_duration: int = 20,
+) -> pd.DataFrame:
+    """
+    Creates the swap structures of many curves at once.
+
+    The par swap rates of all curves follow from one cumulative sum of the
+    discount factors. The curves are the columns of rfr, as in the output
+    of read, and the rows of the result, as in the input of
+    FromParToForwardsBatch.
+
+    Args:
+        rfr (pd.DataFrame or np.array): Risk-free rate term structures with
+            shape (durations, curves), starting at duration 1.
+        additional_swaps (dict, optional): Additional swaps to be included, per
+            maturity a rate or an array of rates per curve, where NaN means
+            no additional swap for that curve. Defaults to {}.
+        cra (float or np.array, optional): Credit risk adjustment subtracted
+            from the additional swaps, scalar or per curve. Defaults to CRA.
+        max_duration (int, optional): Last duration of rfr converted to a
+            swap rate. Defaults to 20.
+
+    Returns:
+        pd.DataFrame: The swap structures with shape (curves, maturities).
+
+    Example:
+        >>> rfr = pd.DataFrame({"Euro": [0.01, 0.02], "USD": [0.03, 0.04]}, index=[1, 2])
+        >>> create_swap_struct_batch(rfr, {5: [0.025, np.nan]}, max_duration=2)
+                 1         2      5
+        Euro  0.01  0.019901  0.024
+        USD   0.03  0.039803    NaN
+    """
+    if isinstance(rfr, pd.DataFrame):
+        curves = rfr.columns
+        rates = rfr.loc[range(1, max_duration + 1)].values.astype("float64")
+    else:
+        rates = np.asarray(rfr, dtype="float64").reshape(len(rfr), -1)
+        curves = range(rates.shape[1])
+        rates = rates[:max_duration]
+    durations = np.arange(1, max_duration + 1)[:, None]
+    df = (1 + rates) ** (-durations)
+    swaps = (1 - df) / np.cumsum(df, axis=0)
+
+    swap_struct = pd.DataFrame(data=swaps.T, index=curves, columns=durations[:, 0])
+    for key in additional_swaps.keys():
+        swap_struct[key] = np.asarray(additional_swaps[key], dtype="float64") - cra
+    return swap_struct
+
+
+def _maturities(x: np.array) -> np.array:
+    """Yearly maturities 1, 2, ... of the last axis of x"""
+    return np.arange(1, x.shape[-1] + 1)
+
+
+def _like(struct, values: np.array):
+    """Returns values as a Series or DataFrame if struct is one"""
+    if isinstance(struct, pd.Series):
+        return pd.Series(data=values, index=struct.index, dtype="float64")
+    if isinstance(struct, pd.DataFrame):
+        return pd.DataFrame(data=values, index=struct.index, columns=struct.columns)
+    return values
+
+
+def forwards2zeros(forwards: np.array) -> np.array:
+    """
+    Converts yearly forward rates to zero rates, annual compounding.
+
+    The zero rate of maturity i is the cumulative product of (1 + f) up to
+    i raised to the power 1/i, minus 1.
+
+    Args:
+        forwards (np.array): Forward rates for the maturities 1, 2, ... along
+            the last axis, 1-D or 2-D.
+
+    Returns:
+        np.array: The zero rates.
+
+    Example:
+        >>> forwards2zeros(np.array([0.01, 0.02, 0.03]))
+        array([0.01      , 0.01498768, 0.01996732])
+    """
+    forwards = np.asarray(forwards, dtype="float64")
+    return np.cumprod(1 + forwards, axis=-1) ** (1 / _maturities(forwards)) - 1
+
+
+def zeros2forwards(zeros: np.array) -> np.array:
+    """
+    Converts zero rates, annual compounding, to yearly forward rates.
+
+    Args:
+        zeros (np.array): Zero rates for the maturities 1, 2, ... along the
+            last axis, 1-D or 2-D.
+
+    Returns:
+        np.array: The forward rates.
+
+    Example:
+        >>> zeros2forwards(forwards2zeros(np.array([0.01, 0.02, 0.03])))
+        array([0.01, 0.02, 0.03])
+    """
+    return discounts2forwards(zeros2discounts(zeros))
+
+
+def forwards2discounts(forwards: np.array) -> np.array:
+    """
+    Converts yearly forward rates to discount factors.
+
+    Args:
+        forwards (np.array): Forward rates for the maturities 1, 2, ... along
+            the last axis, 1-D or 2-D.
+
+    Returns:
+        np.array: The discount factors.
+
+    Example:
+        >>> forwards2discounts(np.array([0.01, 0.02, 0.03]))
+        array([0.99009901, 0.9706853 , 0.94241292])
+    """
+    return 1 / np.cumprod(1 + np.asarray(forwards, dtype="float64"), axis=-1)
+
+
+def discounts2forwards(discounts: np.array) -> np.array:
+    """
+    Converts discount factors to yearly forward rates.
+
+    Args:
+        discounts (np.array): Discount factors for the maturities 1, 2, ...
+            along the last axis, 1-D or 2-D.
+
+    Returns:
+        np.array: The forward rates.
+
+    Example:
+        >>> discounts2forwards(forwards2discounts(np.array([0.01, 0.02, 0.03])))
+        array([0.01, 0.02, 0.03])
+    """
+    discounts = np.asarray(discounts, dtype="float64")
+    previous = np.concatenate(
+        [np.ones(discounts.shape[:-1] + (1,)), discounts[..., :-1]], axis=-1
+    )
+    return previous / discounts - 1
+
+
+def zeros2discounts(zeros: np.array) -> np.array:
+    """
+    Converts zero rates, annual compounding, to discount factors.
+
+    Args:
+        zeros (np.array): Zero rates for the maturities 1, 2, ... along the
+            last axis, 1-D or 2-D.
+
+    Returns:
+        np.array: The discount factors.
+
+    Example:
+        >>> zeros2discounts(np.array([0.01, 0.02, 0.03]))
+        array([0.99009901, 0.96116878, 0.91514166])
+    """
+    zeros = np.asarray(zeros, dtype="float64")
+    return (1 + zeros) ** -_maturities(zeros)
+
+
+def discounts2zeros(discounts: np.array) -> np.array:
+    """
+    Converts discount factors to zero rates, annual compounding.
+
+    Args:
+        discounts (np.array): Discount factors for the maturities 1, 2, ...
+            along the last axis, 1-D or 2-D.
+
+    Returns:
+        np.array: The zero rates.
+
+    Example:
+        >>> discounts2zeros(zeros2discounts(np.array([0.01, 0.02, 0.03])))
+        array([0.01, 0.02, 0.03])
+    """
+    discounts = np.asarray(discounts, dtype="float64")
+    return discounts ** (-1 / _maturities(discounts)) - 1
+
+
 def forwardstruct2termstruct(
     forward_struct: pd.Series(dtype="float64"),
 ) -> pd.Series(dtype="float64"):
@@ -118,15 +489,155 @@ def forwardstruct2termstruct(
     Converts a forward rate structure to a term structure.
 
     Args:
-        forward_struct (pd.Series): The forward rate structure.
+        forward_struct (pd.Series): The forward rate structure, or a DataFrame
+            or array with forward rate structures along the last axis.
 
     Returns:
         pd.Series: The term structure.
     """
-    alt_term_struct = pd.Series(index=forward_struct.index, dtype="float64")
-    alt_term_struct[1] = forward_struct[1]
-    previous_forward = 1 + alt_term_struct[1]
-    for i in range(2, len(forward_struct) + 1):
-        alt_term_struct[i] = (previous_forward * (1 + forward_struct[i])) ** (1 / i) - 1
-        previous_forward = (1 + alt_term_struct[i]) ** i
-    return pd.Series(data=alt_term_struct, index=forward_struct.index, dtype="float64")
+    return _like(forward_struct, forwards2zeros(forward_struct))
+
+
+def termstruct2forwardstruct(
+    term_struct: pd.Series(dtype="float64"),
+) -> pd.Series(dtype="float64"):
+    """
+    Converts a term structure to a forward rate structure, the inverse of
+    forwardstruct2termstruct.
+
+    Args:
+        term_struct (pd.Series): The term structure, or a DataFrame or array
+            with term structures along the last axis.
+
+    Returns:
+        pd.Series: The forward rate structure.
+    """
+    return _like(term_struct, zeros2forwards(term_struct))
+
+
+def alternative_term_structures(
+    rfr: pd.DataFrame = None,
+    meta: pd.DataFrame = None,
+    additional_swaps: dict = {},
+    span: int = 120,
+) -> pd.DataFrame:
+    """
+    Derives the term structures with alternative extrapolation of all
+    currencies of a reference date at once.
+
+    For each currency the spot rates up to its LLP are converted to par swap
+    rates, the additional swaps minus the CRA of that currency are added,
+    and the forward rates bootstrapped from these are kept flat after the
+    last maturity. This is the batch equivalent of create_swap_struct,
+    FromParToForwards and forwardstruct2termstruct per currency.
+
+    Args:
+        rfr (pd.DataFrame): Spot rates indexed by duration with a column per
+            currency, for example RFR_spot_no_VA of the output of read.
+        meta (pd.DataFrame): Metadata with a column per currency, containing
+            the rows LLP and CRA (in basispoints), for example meta of the
+            output of read.
+        additional_swaps (dict, optional): Additional swaps to be included, per
+            maturity a rate, or per currency a pd.Series of rates, where NaN
+            means no additional swap for that currency. Defaults to {}.
+        span (int, optional): The span of the term structures. Defaults to 120.
+
+    Returns:
+        pd.DataFrame: The term structures indexed by duration 1 to span with
+            a column per currency. The term structures of currencies whose
+            spot rates are all NaN or whose LLP is NaN are NaN, for which a
+            warning is logged.
+
+    Example:
+        >>> d = read("2021-12-31")
+        >>> alternative_term_structures(
+        ...     d["RFR_spot_no_VA"][["Euro"]], d["meta"],
+        ...     additional_swaps={25: 0.00522, 30: 0.00476, 40: 0.00400, 50: 0.00340},
+        ... )
+    """
+    currencies = rfr.columns
+    llp = meta.loc["LLP", currencies].values.astype("float64")
+    valid = ~np.isnan(llp) & rfr.notna().any(axis=0).values
+    if not np.all(valid):
+        # currencies without spot rates or LLP have no term structure
+        logging.warning(
+            "No spot rates or LLP for %s, their term structures are NaN",
+            list(currencies[~valid]),
+        )
+        term_structs = pd.DataFrame(
+            np.nan,
+            index=pd.Index(range(1, span + 1), name=rfr.index.name),
+            columns=currencies,
+        )
+        if np.any(valid):
+            term_structs.loc[:, valid] = alternative_term_structures(
+                rfr.loc[:, valid], meta, additional_swaps, span
+            ).values
+        return term_structs
+    llp = llp.astype(int)
+    cra = meta.loc["CRA", currencies].values.astype("float64") / 10000
+
+    swaps = create_swap_struct_batch(rfr, max_duration=int(max(llp)))
+    swaps = swaps.where(swaps.columns.values[None, :] <= llp[:, None])
+    for key in additional_swaps.keys():
+        rates = additional_swaps[key]
+        if isinstance(rates, pd.Series):
+            rates = rates.reindex(currencies)
+        rates = np.broadcast_to(np.asarray(rates, dtype="float64"), cra.shape) - cra
+        if key in swaps.columns:
+            rates = np.where(np.isnan(rates), swaps[key].values, rates)
+        swaps[key] = rates
+    swaps = swaps.sort_index(axis=1)
+
+    forwards = FromParToForwardsBatch(swaps, span=span)
+    return pd.DataFrame(
+        data=forwards2zeros(forwards.values).T,
+        index=pd.Index(range(1, span + 1), name=rfr.index.name),
+        columns=currencies,
+    )
+
+
+def _alternative_term_structures_date(args: tuple) -> pd.DataFrame:
+    """Runs alternative_term_structures for one date, in a worker process"""
+    rfr, meta, additional_swaps, span = args
+    return alternative_term_structures(rfr, meta, additional_swaps, span)
+
+
+def alternative_term_structures_dates(
+    data: dict = {},
+    additional_swaps: dict = {},
+    span: int = 120,
+    scenario: str = "RFR_spot_no_VA",
+    max_workers: int = None,
+) -> dict:
+    """
+    Derives the term structures with alternative extrapolation for multiple
+    reference dates, optionally in a pool of processes.
+
+    Args:
+        data (dict): Output of read per reference date.
+        additional_swaps (dict, optional): Additional swaps per reference date,
+            as in alternative_term_structures. Defaults to {}.
+        span (int, optional): The span of the term structures. Defaults to 120.
+        scenario (str, optional): The spot rates to extrapolate.
+            Defaults to "RFR_spot_no_VA".
+        max_workers (int, optional): Number of worker processes. Defaults to
+            None, which means the dates are processed in the current process.
+
+    Returns:
+        dict: The term structures of alternative_term_structures per reference date.
+
+    Example:
+        >>> data = {date: read(date) for date in ["2021-11-30", "2021-12-31"]}
+        >>> curves = alternative_term_structures_dates(data, max_workers=2)
+    """
+    args = [
+        (d[scenario], d["meta"], additional_swaps.get(date, {}), span)
+        for date, d in data.items()
+    ]
+    if max_workers is None:
+        results = map(_alternative_term_structures_date, args)
+        return dict(zip(data.keys(), results))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_alternative_term_structures_date, args)
+        return dict(zip(data.keys(), results))
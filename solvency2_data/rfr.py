@@ -6,15 +6,27 @@ Main module.
 """
 
 import datetime
-from urllib.request import urlopen
+import logging
 import zipfile
 import os
+import json
+import tempfile
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from os.path import join
 from typing import Union
 
+import numpy as np
 import pandas as pd
+import requests
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from openpyxl.utils import column_index_from_string
+from pandas.io.parsers import TextParser
 
-from solvency2_data.util import get_config
+from solvency2_data.util import get_config, LRUCache, _encode_frame, _decode_frame
 from solvency2_data.scraping import eiopa_link
 
 countries_list = [
@@ -73,6 +85,32 @@ countries_list = [
     "United States",
 ]
 
+# version of the parsed data in the sidecar files, to be increased when the
+# readers of the Excel files change
+SIDECAR_VERSION = 1
+
+# results of read, keyed on reference date and paths, holding the last eight
+# releases; set read_cache.maxsize to hold more or fewer
+read_cache = LRUCache(maxsize=8)
+
+spot_sheets = [
+    "RFR_spot_no_VA",
+    "RFR_spot_with_VA",
+    "Spot_NO_VA_shock_UP",
+    "Spot_NO_VA_shock_DOWN",
+    "Spot_WITH_VA_shock_UP",
+    "Spot_WITH_VA_shock_DOWN",
+]
+
+# keys of the data read from the Term_Structures and the PD_Cod Excel files
+term_structures_keys = ["meta"] + spot_sheets
+
+pd_cod_keys = [
+    "financial fundamental spreads",
+    "non-financial fundamental spreads",
+    "central government fundamental spreads",
+]
+
 currencies = [
     "EUR",
     "BGN",
@@ -110,7 +148,7 @@ currencies = [
 ]
 
 
-def RFR_reference_date(input_date: str = None, cache: dict = {}) -> dict:
+def RFR_reference_date(input_date: str = None, cache: dict = None) -> dict:
     """
     Calculates the reference date based on the input date or the current date.
     If no input date is provided or if the input date is in the future,
@@ -122,13 +160,15 @@ def RFR_reference_date(input_date: str = None, cache: dict = {}) -> dict:
         input_date (str, optional): The input date in the format "%Y-%m-%d".
             Defaults to None, which means the current date is used.
         cache (dict, optional): A dictionary to store the calculated reference date.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
 
     Returns:
         dict: A dictionary containing the input date and the reference date.
             The input date is stored under the key "input_date" in the format "%Y-%m-%d".
             The reference date is stored under the key "reference_date" in the format "%Y%m%d".
     """
+    if cache is None:
+        cache = {}
     if input_date is not None:
         reference_date = datetime.datetime.strptime(input_date, "%Y-%m-%d")
     else:
@@ -151,7 +191,7 @@ def RFR_reference_date(input_date: str = None, cache: dict = {}) -> dict:
     return cache
 
 
-def RFR_dict(input_date: str = None, cache: dict = {}) -> dict:
+def RFR_dict(input_date: str = None, cache: dict = None) -> dict:
     """
     Generates a dictionary containing filenames based on the reference date
     and other data derived from it.
@@ -160,7 +200,7 @@ def RFR_dict(input_date: str = None, cache: dict = {}) -> dict:
         input_date (str, optional): The input date in the format "%Y-%m-%d".
             Defaults to None, which means the current date is used.
         cache (dict, optional): A dictionary to store intermediate and final results.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
 
     Returns:
         dict: A dictionary containing generated filenames and other data.
@@ -170,6 +210,8 @@ def RFR_dict(input_date: str = None, cache: dict = {}) -> dict:
                 - "name_excelfile": The filename for the EIOPA RFR term structures Excel file.
                 - "name_excelfile_spreads": The filename for the EIOPA RFR PD Cod Excel file.
     """
+    if cache is None:
+        cache = {}
     cache = RFR_reference_date(input_date, cache)
     cache["name_excelfile"] = (
         "EIOPA_RFR_" + cache["reference_date"] + "_Term_Structures" + ".xlsx"
@@ -180,15 +222,112 @@ def RFR_dict(input_date: str = None, cache: dict = {}) -> dict:
     return cache
 
 
-def download_RFR(input_date: str = None, cache: dict = {}) -> dict:
+def download_zip(
+    url: str,
+    target: str,
+    proxies: Union[dict, None] = None,
+    timeout: float = 60,
+    retries: int = 3,
+    chunk_size: int = 1 << 20,
+) -> str:
+    """
+    Downloads a file in chunks to a temporary file and renames it to the target
+    when the download is complete.
+
+    The temporary file is the target with ".part" appended. If the connection
+    drops, the download is resumed from the end of the temporary file with an
+    HTTP Range request, also in a later call. The size of the downloaded file
+    is checked against the Content-Length of the response.
+
+    Args:
+        url (str): The URL of the file to download.
+        target (str): The path where the file is saved.
+        proxies: None or a dictionary of proxies to pass in requests.get
+        timeout (float, optional): Timeout in seconds for connecting and for
+            each read. Defaults to 60.
+        retries (int, optional): Number of times a failed download is resumed.
+            Defaults to 3.
+        chunk_size (int, optional): Number of bytes written at a time.
+            Defaults to 1 MiB.
+
+    Returns:
+        str: The path of the downloaded file.
+    """
+    part = target + ".part"
+    for attempt in range(retries + 1):
+        offset = os.path.getsize(part) if os.path.isfile(part) else 0
+        headers = {"Range": "bytes=%d-" % offset} if offset > 0 else {}
+        try:
+            with requests.get(
+                url, headers=headers, proxies=proxies, stream=True, timeout=timeout
+            ) as response:
+                if response.status_code == 416:
+                    # the temporary file is not a prefix of the file, start over
+                    os.remove(part)
+                    raise IOError("Range not satisfiable for " + url)
+                response.raise_for_status()
+                if response.status_code != 206:
+                    # the server does not resume, start over
+                    offset = 0
+                expected = response.headers.get("Content-Length")
+                if expected is not None:
+                    expected = offset + int(expected)
+                with open(part, "ab" if offset > 0 else "wb") as output:
+                    for chunk in response.iter_content(chunk_size):
+                        output.write(chunk)
+            size = os.path.getsize(part)
+            if expected is not None and size != expected:
+                raise IOError(
+                    "Downloaded %d of %d bytes from %s" % (size, expected, url)
+                )
+        except (requests.RequestException, IOError) as e:
+            if attempt == retries:
+                raise
+            logging.warning("Download interrupted, resuming: " + str(e))
+            continue
+        os.replace(part, target)
+        return target
+
+
+def _local_zipfile(cache: dict) -> Union[str, None]:
+    """
+    Returns the name of a zip-file in the folder of the zip-files that
+    contains both Excel files of cache, or None if there is none.
+    """
+    if not os.path.isdir(cache["path_zipfile"]):
+        return None
+    names = [cache["name_excelfile"].lower(), cache["name_excelfile_spreads"].lower()]
+    for file in sorted(os.listdir(cache["path_zipfile"])):
+        if not file.lower().endswith(".zip"):
+            continue
+        try:
+            with zipfile.ZipFile(join(cache["path_zipfile"], file)) as zip_ref:
+                members = [name.lower() for name in zip_ref.namelist()]
+        except (OSError, zipfile.BadZipFile):
+            continue
+        if all(name in members for name in names):
+            return file
+    return None
+
+
+def download_RFR(
+    input_date: str = None, cache: dict = None, extract: bool = True
+) -> dict:
     """
     Downloads EIOPA RFR (Risk-Free Rate) files for a given date and saves them locally.
 
+    If the Excel files are not in the folder of the Excel files, a zip file in
+    the folder of the zip files that contains them is used. Only if there is
+    none, the zip file is downloaded.
+
     Args:
         input_date (str, optional): The input date in the format "%Y-%m-%d".
             Defaults to None, which means the current date is used.
         cache (dict, optional): A dictionary to store intermediate and final results.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
+        extract (bool, optional): Extract the Excel files from the downloaded
+            zip file. If False the names of the Excel files are the names of the
+            members of the zip file. Defaults to True.
 
     Returns:
         dict: A dictionary containing information about the downloaded files and paths.
@@ -202,6 +341,8 @@ def download_RFR(input_date: str = None, cache: dict = {}) -> dict:
                 - "path_excelfile": The path where the Excel files are saved.
                 - "path_zipfile": The path where the zip file is saved.
     """
+    if cache is None:
+        cache = {}
     cache = RFR_dict(input_date, cache)
 
     name_excelfile = None
@@ -214,19 +355,25 @@ def download_RFR(input_date: str = None, cache: dict = {}) -> dict:
             cache["name_excelfile_spreads"] = name_excelfile_spreads = file
 
     if name_excelfile is None or name_excelfile_spreads is None:
-        # determine correct url and zipfile
-        cache["url"] = eiopa_link(
-            cache["input_date"], data_type="rfr", proxies=cache.get("proxies", None)
-        )
-        cache["name_zipfile"] = os.path.basename(cache["url"]).split("filename=")[-1]
-
-        # download file
-        request = urlopen(cache["url"], cache.get("proxies", None))
-
-        # save zip-file
-        output = open(join(cache["path_zipfile"], cache["name_zipfile"]), "wb")
-        output.write(request.read())
-        output.close()
+        # use a zip-file downloaded earlier if it contains the Excel files
+        cache["name_zipfile"] = _local_zipfile(cache)
+
+        if cache["name_zipfile"] is None:
+            # determine correct url and zipfile
+            cache["url"] = eiopa_link(
+                cache["input_date"],
+                data_type="rfr",
+                proxies=cache.get("proxies", None),
+            )
+            name_zipfile = os.path.basename(cache["url"])
+            cache["name_zipfile"] = name_zipfile.split("filename=")[-1]
+
+            # download and save zip-file
+            download_zip(
+                cache["url"],
+                join(cache["path_zipfile"], cache["name_zipfile"]),
+                proxies=cache.get("proxies", None),
+            )
 
         name_excelfile = None
         name_excelfile_spreads = None
@@ -236,9 +383,9 @@ def download_RFR(input_date: str = None, cache: dict = {}) -> dict:
                 cache["name_excelfile"] = name_excelfile = name
             if name.lower() == cache["name_excelfile_spreads"].lower():
                 cache["name_excelfile_spreads"] = name_excelfile_spreads = name
-        if name_excelfile is not None:
+        if extract and name_excelfile is not None:
             zip_ref.extract(name_excelfile, cache["path_excelfile"])
-        if name_excelfile_spreads is not None:
+        if extract and name_excelfile_spreads is not None:
             zip_ref.extract(name_excelfile_spreads, cache["path_excelfile"])
         zip_ref.close()
 
@@ -248,14 +395,14 @@ def download_RFR(input_date: str = None, cache: dict = {}) -> dict:
     return cache
 
 
-def read_spreads(xls: pd.ExcelFile, cache: dict = {}) -> dict:
+def read_spreads(xls: pd.ExcelFile, cache: dict = None) -> dict:
     """
     Reads financial and non-financial fundamental spreads from an Excel file and stores them in a dictionary.
 
     Args:
         xls (pd.ExcelFile): An ExcelFile object containing the spreadsheets.
         cache (dict, optional): A dictionary to store the read spreadsheets.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
 
     Returns:
         dict: A dictionary containing the read spreadsheets.
@@ -267,6 +414,8 @@ def read_spreads(xls: pd.ExcelFile, cache: dict = {}) -> dict:
             Each sub-dictionary contains DataFrames with financial or non-financial spreads
             for the respective currencies.
     """
+    if cache is None:
+        cache = {}
     cache["financial fundamental spreads"] = {}
     for name in currencies:
         if name in xls.sheet_names:
@@ -300,14 +449,99 @@ def read_spreads(xls: pd.ExcelFile, cache: dict = {}) -> dict:
     return cache
 
 
-def read_govies(xls, cache: dict = {}) -> dict:
+def _load_workbook(io, member: str = None):
+    """
+    Opens an Excel file in read-only mode, from a zip file if member is given.
+    """
+    if member is not None:
+        with zipfile.ZipFile(io) as zip_ref:
+            io = BytesIO(zip_ref.read(member))
+    return load_workbook(io, read_only=True, data_only=True, keep_links=False)
+
+
+def read_pd_cod(io, cache: dict = None, member: str = None, keys: list = None) -> dict:
+    """
+    Reads the fundamental spreads and the central government fundamental
+    spreads from the PD_Cod Excel file in a single pass.
+
+    The workbook is opened once in read-only mode and the rows of each
+    currency sheet are read once, after which the financial and the
+    non-financial blocks of columns W:AC are parsed from the same rows. The
+    result is the same as read_spreads and read_govies.
+
+    Args:
+        io : Path or file-like object of the Excel file, or of the zip file
+            containing it if member is given.
+        cache (dict, optional): A dictionary to store the read spreads.
+            Defaults to None, which means a new dictionary is used.
+        member (str, optional): Name of the Excel file in the zip file io.
+            Defaults to None, which means io is the Excel file.
+        keys (list, optional): The keys of pd_cod_keys to read. The financial
+            and non-financial fundamental spreads are always read together.
+            Defaults to None, which means all keys are read.
+
+    Returns:
+        dict: A dictionary containing the read spreads, with the keys as in
+            read_spreads and read_govies.
+    """
+    if cache is None:
+        cache = {}
+    if keys is None:
+        keys = pd_cod_keys
+    spreads_columns = list(
+        range(column_index_from_string("W") - 1, column_index_from_string("AC"))
+    )
+    book = _load_workbook(io, member)
+    try:
+        if set(keys) & set(pd_cod_keys[:2]):
+            cache["financial fundamental spreads"] = {}
+            cache["non-financial fundamental spreads"] = {}
+        for name in currencies:
+            if set(keys) & set(pd_cod_keys[:2]) and name in book.sheetnames:
+                # the header row and 30 rows of both blocks
+                data = _sheet_data(book[name], max_rows=80)
+                for key, skiprows in [
+                    ("financial fundamental spreads", 8),
+                    ("non-financial fundamental spreads", 48),
+                ]:
+                    df = _parse_sheet(
+                        data,
+                        header=1,
+                        usecols=spreads_columns,
+                        nrows=30,
+                        skiprows=skiprows,
+                        names=[0, 1, 2, 3, 4, 5, 6],
+                    )
+                    df.index = range(1, 31)
+                    cache[key][name] = df
+
+        if "central government fundamental spreads" in keys:
+            cache["central government fundamental spreads"] = None
+        if "central government fundamental spreads" in keys and (
+            "FS_Govts" in book.sheetnames
+        ):
+            df = _parse_sheet(
+                _sheet_data(book["FS_Govts"], max_rows=63),
+                usecols=list(range(1, column_index_from_string("AF"))),
+                nrows=53,
+                index_col=0,
+                skiprows=9,
+            )
+            cache["central government fundamental spreads"] = df.T
+    finally:
+        book.close()
+
+    return cache
+
+
+def read_govies(xls, cache: dict = None) -> dict:
     """
     Reads central government fundamental spreads from an Excel file and stores them in a dictionary.
 
     Args:
         xls : An object representing the Excel file.
         cache (dict, optional): A dictionary to store the read spreadsheets.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
 
     Returns:
         dict: A dictionary containing the read spreadsheets.
@@ -315,6 +549,8 @@ def read_govies(xls, cache: dict = {}) -> dict:
                 - "central government fundamental spreads": A DataFrame containing central government spreads.
             The DataFrame includes spreads for various financial attributes indexed by dates.
     """
+    if cache is None:
+        cache = {}
     cache["central government fundamental spreads"] = None
     for name in ["FS_Govts"]:
         if name in xls.sheet_names:
@@ -333,14 +569,14 @@ def read_govies(xls, cache: dict = {}) -> dict:
     return cache
 
 
-def read_spot(xls, cache: dict = {}) -> dict:
+def read_spot(xls, cache: dict = None) -> dict:
     """
     Reads various spot data from an Excel file and stores them in a dictionary.
 
     Args:
         xls : An object representing the Excel file.
         cache (dict, optional): A dictionary to store the read spot data.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
 
     Returns:
         dict: A dictionary containing the read spot data.
@@ -353,38 +589,26 @@ def read_spot(xls, cache: dict = {}) -> dict:
                 - "Spot_WITH_VA_shock_DOWN": DataFrame containing spot data with VA with DOWN shock.
             Each DataFrame contains spot data indexed by duration.
     """
-    for name in [
-        "RFR_spot_no_VA",
-        "RFR_spot_with_VA",
-        "Spot_NO_VA_shock_UP",
-        "Spot_NO_VA_shock_DOWN",
-        "Spot_WITH_VA_shock_UP",
-        "Spot_WITH_VA_shock_DOWN",
-    ]:
+    if cache is None:
+        cache = {}
+    for name in spot_sheets:
         if name in xls.sheet_names:
             df = pd.read_excel(
                 io=xls, sheet_name=name, header=1, nrows=158, index_col=1
             )
-            # drop unnamed columns from the excel file
-            for col in df.columns:
-                if "Unnamed:" in col:
-                    df = df.drop(col, axis=1)
-            df.loc["VA"] = df.loc["VA"].infer_objects().fillna(0, inplace=False)
-            df = df.iloc[8:]
-            df.index.names = ["Duration"]
-            cache[name] = df
+            cache[name] = _spot_frame(df)
 
     return cache
 
 
-def read_meta(xls, cache: str = {}) -> dict:
+def read_meta(xls, cache: dict = None) -> dict:
     """
     Reads metadata from an Excel file and stores it in a dictionary.
 
     Args:
         xls : An object representing the Excel file.
         cache (dict, optional): A dictionary to store the read metadata.
-            Defaults to an empty dictionary.
+            Defaults to None, which means a new dictionary is used.
 
     Returns:
         dict: A dictionary containing the read metadata.
@@ -393,14 +617,36 @@ def read_meta(xls, cache: str = {}) -> dict:
             The DataFrame includes metadata indexed by "meta" and may include information
             such as headers, column descriptions, and other relevant details.
     """
+    if cache is None:
+        cache = {}
     df_meta = pd.read_excel(
         xls, sheet_name="RFR_spot_with_VA", header=1, index_col=1, skipfooter=150
     )
-    # drop unnamed columns from the excel file
-    for col in df_meta.columns:
+    cache["meta"] = _meta_frame(df_meta)
+
+    return cache
+
+
+def _drop_unnamed(df: pd.DataFrame) -> pd.DataFrame:
+    """Drops the unnamed columns of a sheet from the excel file"""
+    for col in df.columns:
         if "Unnamed:" in col:
-            df_meta = df_meta.drop(col, axis=1)
+            df = df.drop(col, axis=1)
+    return df
+
 
+def _spot_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Spot rates indexed by duration from a parsed term structure sheet"""
+    df = _drop_unnamed(df)
+    df.loc["VA"] = df.loc["VA"].infer_objects().fillna(0, inplace=False)
+    df = df.iloc[8:]
+    df.index.names = ["Duration"]
+    return df
+
+
+def _meta_frame(df_meta: pd.DataFrame) -> pd.DataFrame:
+    """Metadata from the parsed RFR_spot_with_VA sheet"""
+    df_meta = _drop_unnamed(df_meta)
     df_meta.loc["VA"] = df_meta.loc["VA"].infer_objects().fillna(0, inplace=False)
     df_meta = df_meta.iloc[0:8]
     df_meta.index.names = ["meta"]
@@ -411,16 +657,393 @@ def read_meta(xls, cache: str = {}) -> dict:
     #                          columns=df_meta.columns)
     # # df_append.loc['reference date'] = cache["reference_date"]
     # df_meta = df_meta.append(df_append)
+    return df_meta
+
+
+def _sheet_data(sheet, max_rows: int = None) -> list:
+    """
+    Reads the cell values of a read-only openpyxl sheet in one pass, converted
+    as pd.read_excel does: empty cells become "", error cells NaN and integral
+    numbers int, with trailing empty cells and rows removed.
+    """
+    sheet.reset_dimensions()
+    data = []
+    last_row_with_data = -1
+    for row_number, row in enumerate(sheet.rows):
+        converted_row = []
+        for cell in row:
+            value = cell.value
+            if value is None:
+                value = ""
+            elif cell.data_type == TYPE_ERROR:
+                value = np.nan
+            elif cell.data_type == TYPE_NUMERIC and int(value) == value:
+                value = int(value)
+            converted_row.append(value)
+        while converted_row and converted_row[-1] == "":
+            converted_row.pop()
+        if converted_row:
+            last_row_with_data = row_number
+        data.append(converted_row)
+        if max_rows is not None and len(data) >= max_rows:
+            break
+    data = data[: last_row_with_data + 1]
+    if len(data) > 0:
+        max_width = max(len(data_row) for data_row in data)
+        data = [data_row + (max_width - len(data_row)) * [""] for data_row in data]
+    return data
+
+
+def _parse_sheet(data: list, **kwds) -> pd.DataFrame:
+    """Parses sheet data from _sheet_data as pd.read_excel does"""
+    nrows = kwds.get("nrows", None)
+    return TextParser([row[:] for row in data], skip_blank_lines=False, **kwds).read(
+        nrows
+    )
+
+
+def read_term_structures(
+    io, cache: dict = None, member: str = None, keys: list = None
+) -> dict:
+    """
+    Reads the metadata and the spot rates of all scenarios from the
+    Term_Structures Excel file in a single pass.
+
+    The workbook is opened once in read-only mode and the rows of each sheet
+    are read once, so the RFR_spot_with_VA sheet provides both the metadata
+    and its spot rates. The result is the same as read_meta and read_spot.
+
+    Args:
+        io : Path or file-like object of the Excel file, or of the zip file
+            containing it if member is given.
+        cache (dict, optional): A dictionary to store the read data.
+            Defaults to None, which means a new dictionary is used.
+        member (str, optional): Name of the Excel file in the zip file io.
+            Defaults to None, which means io is the Excel file.
+        keys (list, optional): The keys of term_structures_keys to read.
+            Defaults to None, which means all keys are read.
+
+    Returns:
+        dict: A dictionary containing the read data, with the key "meta" as
+            in read_meta and the keys of the spot rates as in read_spot.
+    """
+    if cache is None:
+        cache = {}
+    if keys is None:
+        keys = term_structures_keys
+    book = _load_workbook(io, member)
+    try:
+        sheet_data = {}
+        if "meta" in keys and "RFR_spot_with_VA" in book.sheetnames:
+            sheet_data["RFR_spot_with_VA"] = _sheet_data(book["RFR_spot_with_VA"])
+            cache["meta"] = _meta_frame(
+                _parse_sheet(
+                    sheet_data["RFR_spot_with_VA"],
+                    header=1,
+                    index_col=1,
+                    skipfooter=150,
+                )
+            )
+        for name in spot_sheets:
+            if name in keys and name in book.sheetnames:
+                if name not in sheet_data:
+                    # the header row and 158 rows of metadata and spot rates
+                    sheet_data[name] = _sheet_data(book[name], max_rows=160)
+                cache[name] = _spot_frame(
+                    _parse_sheet(sheet_data[name], header=1, nrows=158, index_col=1)
+                )
+    finally:
+        book.close()
+
+    return cache
+
 
-    cache["meta"] = df_meta
+def _write_sidecar(sidecar: str, source: list, data: dict) -> None:
+    """
+    Writes the source and the data read from an Excel file to an npz file,
+    with the DataFrames as arrays of numbers and the rest as JSON.
+    """
+    arrays = {}
+    layout = {}
+    for key, value in data.items():
+        if isinstance(value, pd.DataFrame):
+            layout[key] = {"frame": _encode_frame(value, arrays)}
+        elif isinstance(value, dict):
+            layout[key] = {
+                "frames": {
+                    name: _encode_frame(df, arrays) for name, df in value.items()
+                }
+            }
+        else:
+            layout[key] = {"value": value}
+    arrays["layout"] = np.array(json.dumps({"source": source, "data": layout}))
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(sidecar) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, sidecar)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _load_sidecar(sidecar: str) -> tuple:
+    """
+    Reads the source and the data of an npz file written by _write_sidecar,
+    without unpickling.
+    """
+    with np.load(sidecar, allow_pickle=False) as arrays:
+        layout = json.loads(str(arrays["layout"]))
+        data = {}
+        for key, value in layout["data"].items():
+            if "frame" in value:
+                data[key] = _decode_frame(value["frame"], arrays)
+            elif "frames" in value:
+                data[key] = {
+                    name: _decode_frame(desc, arrays)
+                    for name, desc in value["frames"].items()
+                }
+            else:
+                data[key] = value["value"]
+    return layout["source"], data
+
+
+def read_with_sidecar(io: str, reader, cache: dict = None, member: str = None) -> dict:
+    """
+    Reads an Excel file with a reader function, using a sidecar file with the
+    parsed data next to the Excel file.
+
+    The sidecar file is the path of the Excel file with ".npz" appended, or
+    the path of the zip file with the name of the member and ".npz" appended.
+    It holds the values of the DataFrames as arrays of numbers and the labels
+    and other values as JSON, so reading it does not unpickle anything. It is
+    used if it was written for a file with the same size and modification
+    time and the same SIDECAR_VERSION, otherwise the Excel file is parsed and
+    the sidecar file is (re)written. If the sidecar file cannot be written the
+    parsed data is returned all the same.
+
+    Args:
+        io (str): Path of the Excel file, or of the zip file containing it if
+            member is given.
+        reader: Function reading the Excel file into a dictionary, for example
+            read_term_structures or read_pd_cod.
+        cache (dict, optional): A dictionary to store the read data.
+            Defaults to None, which means a new dictionary is used.
+        member (str, optional): Name of the Excel file in the zip file io.
+            Defaults to None, which means io is the Excel file.
 
+    Returns:
+        dict: A dictionary containing the read data.
+    """
+    if cache is None:
+        cache = {}
+    sidecar = io + ".npz"
+    if member is not None:
+        sidecar = io + "." + os.path.basename(member) + ".npz"
+    stat = os.stat(io)
+    source = [SIDECAR_VERSION, stat.st_size, stat.st_mtime_ns]
+    if os.path.isfile(sidecar):
+        try:
+            stored_source, data = _load_sidecar(sidecar)
+            if stored_source == source:
+                cache.update(data)
+                return cache
+        except Exception:
+            # an unreadable sidecar file is rewritten below
+            pass
+
+    data = reader(io, {}, member)
+    try:
+        _write_sidecar(sidecar, source, data)
+    except (OSError, TypeError, ValueError):
+        # data that cannot be written as JSON is parsed again next time
+        pass
+    cache.update(data)
     return cache
 
 
-def read(input_date=None, path: str = None, proxies: Union[dict, None] = None) -> dict:
+def _copy_value(value):
+    """Copy of a value of read, copying the DataFrames in it"""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    return value
+
+
+def _copy_release(cache) -> dict:
+    """Copy of the result of read, so that changes do not alter read_cache"""
+    return {key: _copy_value(value) for key, value in cache.items()}
+
+
+# the Excel files of a release and the functions reading them
+release_readers = [
+    ("name_excelfile", read_term_structures),
+    ("name_excelfile_spreads", read_pd_cod),
+]
+
+
+def _release_file(cache: dict, name: str) -> tuple:
+    """
+    Returns the path and the zip file member of the Excel file cache[name], the
+    member being None if the Excel file was extracted.
+    """
+    io = join(cache["path_excelfile"], cache[name])
+    if os.path.isfile(io):
+        return io, None
+    # not extracted, read from the zip file
+    return join(cache["path_zipfile"], cache["name_zipfile"]), cache[name]
+
+
+class LazyRelease(Mapping):
+    """
+    Read-only mapping with the data of an EIOPA release, which reads the data
+    of a key from the Excel files on first access and then keeps it. Each
+    access returns a copy of the DataFrames.
+
+    Attributes:
+        data (dict): The data read so far, starting with the file names and
+            paths of download_RFR.
+
+    Methods:
+        __init__(cache): Initialize the mapping from the result of download_RFR.
+        __getitem__(key): The data of a key, reading it if needed.
+        __iter__(): Iterate over the keys, reading only the sheet names.
+        __len__(): Number of keys.
+    """
+
+    def __init__(self, cache: dict):
+        """
+        Initialize the mapping.
+
+        Args:
+            cache (dict): The result of download_RFR, with the names and paths
+                of the Excel files.
+
+        Returns:
+            None
+        """
+        self.data = dict(cache)
+        self._sources = {}
+        self._available = None
+        self._lock = threading.RLock()
+        for (name, reader), keys in zip(
+            release_readers, [term_structures_keys, pd_cod_keys]
+        ):
+            io, member = _release_file(cache, name)
+            for key in keys:
+                self._sources[key] = (reader, io, member)
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key not in self.data and key in self._sources:
+                reader, io, member = self._sources[key]
+                self.data.update(reader(io, {}, member, keys=[key]))
+            return _copy_value(self.data[key])
+
+    def _keys(self) -> list:
+        """
+        The keys of the release, for which only the sheet names of the
+        Term_Structures Excel file are read, because its keys are sheets.
+        """
+        with self._lock:
+            if self._available is None:
+                reader, io, member = self._sources["meta"]
+                book = _load_workbook(io, member)
+                sheetnames = book.sheetnames
+                book.close()
+                self._available = [
+                    key
+                    for key in self._sources
+                    if key in pd_cod_keys
+                    or key in sheetnames
+                    or (key == "meta" and "RFR_spot_with_VA" in sheetnames)
+                ]
+            return list(self.data) + [
+                key for key in self._available if key not in self.data
+            ]
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return "LazyRelease(%s, read=%s)" % (
+            self.data.get("reference_date"),
+            [key for key in self._sources if key in self.data],
+        )
+
+
+def _read_paths(path: str = None) -> tuple:
+    """
+    Returns the paths of the zip files and the Excel files used by read.
+    """
+    if path is None:
+        # look in current directory for .cfg file
+        # if not exists then take the .cfg file in the package directory
+        config = get_config().get("Directories")
+        return config.get("zip_files"), config.get("excel_files")
+    return path, path
+
+
+def read_cache_key(input_date=None, path: str = None) -> tuple:
+    """
+    Returns the key of the results of read in read_cache.
+
+    Args:
+        input_date (str, optional): The input date in the format "%Y-%m-%d".
+            Defaults to None, which means the current date is used.
+        path (str, optional): The path to the directory containing Excel files.
+            Defaults to None.
+
+    Returns:
+        tuple: The reference date in the format "%Y%m%d", the path of the zip
+            files and the path of the Excel files.
+    """
+    reference_date = RFR_reference_date(input_date)["reference_date"]
+    return (reference_date,) + _read_paths(path)
+
+
+def invalidate_read_cache(input_date=None, path: str = None) -> None:
+    """
+    Removes the results of read for a date from read_cache, or all results if
+    input_date and path are None.
+
+    Args:
+        input_date (str, optional): The input date in the format "%Y-%m-%d".
+            Defaults to None.
+        path (str, optional): The path to the directory containing Excel files.
+            Defaults to None.
+
+    Returns:
+        None
+    """
+    if input_date is None and path is None:
+        read_cache.invalidate()
+    else:
+        read_cache.invalidate(read_cache_key(input_date, path))
+
+
+def read(
+    input_date=None,
+    path: str = None,
+    proxies: Union[dict, None] = None,
+    sidecar: bool = True,
+    use_cache: bool = True,
+    extract: bool = True,
+    lazy: bool = False,
+) -> dict:
     """
     Reads data from Excel files and stores it in a dictionary.
 
+    The results are kept in read_cache, a bounded cache keyed on the reference
+    date and the paths, so that reading the same release again does not parse
+    the Excel files. Use invalidate_read_cache to remove results from it.
+    Each call returns copies of the DataFrames, so changing them does not
+    change the results of later calls.
+
     Args:
         input_date (str, optional): The input date in the format "%Y-%m-%d".
             Defaults to None, which means the current date is used.
@@ -429,43 +1052,143 @@ def read(input_date=None, path: str = None, proxies: Union[dict, None] = None) -
             Defaults to None.
         proxies: None or a dictionary of proxies to be used when downloading rates
             (None turns off proxies completely)
+        sidecar (bool, optional): Use sidecar files with the parsed data next to
+            the Excel files, see read_with_sidecar. Defaults to True.
+        use_cache (bool, optional): Look up and store the results in read_cache.
+            Defaults to True.
+        extract (bool, optional): Extract the Excel files from a downloaded zip
+            file. If False they are read from the zip file directly, which does
+            not need a writable folder for the Excel files. Defaults to True.
+        lazy (bool, optional): Return a LazyRelease, which reads each key from
+            the Excel files on first access, instead of reading all keys.
+            Sidecar files are not used in this case. A later read with lazy
+            False reads all keys and replaces the LazyRelease in read_cache.
+            Defaults to False.
 
     Returns:
         dict: A dictionary containing the read data.
             The dictionary includes various keys storing downloaded files, metadata, spot data, spreadsheets, etc.
     """
-    if path is None:
-        # look in current directory for .cfg file
-        # if not exists then take the .cfg file in the package directory
-        config = get_config().get("Directories")
-
-        path_zipfile = config.get("zip_files")
-        path_excelfile = config.get("excel_files")
+    path_zipfile, path_excelfile = _read_paths(path)
+
+    cache = None
+    if use_cache:
+        key = read_cache_key(input_date, path)
+        cached = read_cache.get(key)
+        if cached is not None:
+            if not isinstance(cached, LazyRelease):
+                return _copy_release(cached)
+            if lazy:
+                return cached
+            # read all keys of the cached lazy release at once, through the
+            # sidecar files, and keep that instead of the lazy release
+            cache = {
+                name: value
+                for name, value in cached.data.items()
+                if name not in cached._sources
+            }
+
+    if cache is None:
+        cache = {
+            "path_zipfile": path_zipfile,
+            "path_excelfile": path_excelfile,
+        }
+        if proxies is not None:
+            cache["proxies"] = proxies
+        cache = download_RFR(input_date, cache, extract)
+
+    if lazy:
+        cache = LazyRelease(cache)
     else:
-        path_zipfile = path
-        path_excelfile = path
-
-    cache = {
-        "path_zipfile": path_zipfile,
-        "path_excelfile": path_excelfile,
-    }
-    if proxies is not None:
-        cache["proxies"] = proxies
-
-    cache = download_RFR(input_date, cache)
-    xls = pd.ExcelFile(
-        join(cache["path_excelfile"], cache["name_excelfile"]), engine="openpyxl"
-    )
-    cache = read_meta(xls, cache)
-    cache = read_spot(xls, cache)
-    xls_spreads = pd.ExcelFile(
-        join(cache["path_excelfile"], cache["name_excelfile_spreads"]),
-        engine="openpyxl",
-    )
-    cache = read_spreads(xls_spreads, cache)
-    cache = read_govies(xls_spreads, cache)
+        for name, reader in release_readers:
+            io, member = _release_file(cache, name)
+            if sidecar:
+                cache = read_with_sidecar(io, reader, cache, member)
+            else:
+                cache = reader(io, cache, member)
+
+    if use_cache:
+        read_cache.put(key, cache)
+        return cache if lazy else _copy_release(cache)
+    return cache
 
-    xls.close()
-    xls_spreads.close()
 
-    return cache
+def _read_date(args: tuple) -> dict:
+    """Runs read for one date, in a worker process"""
+    input_date, path, proxies, sidecar = args
+    return dict(read(input_date, path, proxies, sidecar, use_cache=False))
+
+
+def read_range(
+    dates,
+    path: str = None,
+    proxies: Union[dict, None] = None,
+    sidecar: bool = True,
+    max_workers: int = None,
+) -> dict:
+    """
+    Reads the releases of multiple dates, optionally in a pool of processes,
+    into panels with the reference date as the first index level.
+
+    The results are not kept in read_cache.
+
+    Args:
+        dates: The input dates, as strings in the format "%Y-%m-%d" or as
+            datetimes, for example a pd.date_range.
+        path (str, optional): The path to the directory containing Excel files,
+            as in read. Defaults to None.
+        proxies: None or a dictionary of proxies to be used when downloading rates
+            (None turns off proxies completely)
+        sidecar (bool, optional): Use sidecar files with the parsed data next to
+            the Excel files, see read_with_sidecar. Defaults to True.
+        max_workers (int, optional): Number of worker processes. Defaults to
+            None, which means the dates are read in the current process.
+
+    Returns:
+        dict: A dictionary with a DataFrame per key of read:
+            - "meta": indexed by ref_date and the rows of the metadata.
+            - the spot rates: indexed by ref_date and Duration, with a column
+              per country.
+            - "financial fundamental spreads" and "non-financial fundamental
+              spreads": indexed by ref_date, currency and duration, with a
+              column per credit quality step.
+            - "central government fundamental spreads": indexed by ref_date
+              and the durations, with a column per country.
+
+    Example:
+        >>> dates = pd.date_range("2021-01-31", "2021-12-31", freq="M")
+        >>> panel = read_range(dates, max_workers=4)
+        >>> panel["RFR_spot_no_VA"]["Euro"].unstack("ref_date")
+    """
+    # one date per release, so that no two workers download or write the
+    # sidecar files of the same release
+    input_dates = []
+    for date in dates:
+        date = pd.Timestamp(date).strftime("%Y-%m-%d")
+        date = RFR_reference_date(date)["input_date"]
+        if date not in input_dates:
+            input_dates.append(date)
+    args = [(date, path, proxies, sidecar) for date in input_dates]
+    if max_workers is None:
+        results = list(map(_read_date, args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_read_date, args))
+
+    panel = {}
+    ref_dates = [pd.Timestamp(result["input_date"]) for result in results]
+    for key in term_structures_keys + pd_cod_keys:
+        frames = {}
+        for ref_date, result in zip(ref_dates, results):
+            if result.get(key) is None:
+                continue
+            if isinstance(result[key], dict):
+                if len(result[key]) > 0:
+                    frames[ref_date] = pd.concat(
+                        result[key], names=["currency", "duration"]
+                    )
+            else:
+                frames[ref_date] = result[key]
+        if len(frames) > 0:
+            panel[key] = pd.concat(frames, names=["ref_date"])
+    return panel
@@ -1,5 +1,23 @@
+import copy
+from collections import namedtuple
+
 import numpy as np
-from numpy.linalg import inv
+
+from .util import hash_key
+
+# All Smith-Wilson output curves of one calibration, returned by smith_wilson
+# and smith_wilson_batch with output_type "all"
+SmithWilsonOutput = namedtuple(
+    "SmithWilsonOutput",
+    [
+        "zero_rates",
+        "forward_rates",
+        "discount_rates",
+        "forward_intensities",
+        "yield_intensities",
+        "alfa",
+    ],
+)
 
 
 def big_h(u: np.array, v: np.array) -> np.array:
@@ -27,12 +45,22 @@ def big_h(u: np.array, v: np.array) -> np.array:
     return left - right
 
 
-def big_g(alfa: float, q: np.array, nrofcoup: float, t2: float, tau: float) -> np.array:
+def big_g(
+    alfa: float,
+    q: np.array,
+    nrofcoup: float,
+    t2: float,
+    tau: float,
+) -> np.array:
     """
     Calculates the big g-function according to specification 156.
 
+    If alfa is an array of alfa values, the h-matrices of all alfas are
+    stacked and solved together, and the gaps and gammas are returned with
+    the shape of alfa as leading dimensions.
+
     Args:
-        alfa (float): Alfa value.
+        alfa (float): Alfa value, or array of alfa values.
         q (np.array): Input array for q.
         nrofcoup (float): Number of coupons.
         t2 (float): T2 value.
@@ -53,28 +81,200 @@ def big_g(alfa: float, q: np.array, nrofcoup: float, t2: float, tau: float) -> n
                [-0.30490089]]))
     """
     n, m = q.shape
-    # construct m*m h-matrix
-    h = np.fromfunction(
-        lambda i, j: big_h(alfa * (i + 1) / nrofcoup, alfa * (j + 1) / nrofcoup), (m, m)
-    )
-    # Solving b according to 156 of specs, note: p = 1 by construction
-    res_1 = np.array([1 - np.sum(q[i]) for i in range(n)]).reshape((n, 1))
-    # b = ((Q'HQ)^(-1))(1-Q'1) according to 156 of the specs
-    b = np.matmul(inv(np.matmul(np.matmul(q, h), q.T)), res_1)
+    # only the cash flow maturities with a pay-off enter the system, so the
+    # h-matrix is the Wilson kernel (without the ufr discounting) of these
+    # maturities instead of the m*m matrix of all cash flow maturities
+    payoffs = np.flatnonzero(np.any(q != 0, axis=0))
+    u = (payoffs + 1) / nrofcoup
+    q_payoffs = q[:, payoffs]
+    alfa = np.asarray(alfa, dtype="float64")
+    h = big_h(alfa[..., None, None] * u[:, None], alfa[..., None, None] * u)
+    if q_payoffs.shape == (n, n) and np.array_equal(
+        q_payoffs, np.diag(np.diag(q_payoffs))
+    ):
+        # for zero-coupon instruments Q is diagonal and gamma = Qb according
+        # to 156 of the specs reduces to H^(-1)(Q^(-1)1 - 1)
+        res_1 = 1 / np.diag(q_payoffs) - 1
+        gamma_payoffs = np.linalg.solve(
+            h, np.broadcast_to(res_1[:, None], alfa.shape + (n, 1))
+        )
+    else:
+        # b = ((Q'HQ)^(-1))(1-Q'1) according to 156 of the specs
+        res_1 = 1 - np.sum(q_payoffs, axis=1)
+        b = np.linalg.solve(
+            np.matmul(np.matmul(q_payoffs, h), q_payoffs.T),
+            np.broadcast_to(res_1[:, None], alfa.shape + (n, 1)),
+        )
+        gamma_payoffs = np.matmul(q_payoffs.T, b)
     # gamma variable is used to store Qb according to 156 of specs
-    gamma = np.matmul(q.T, b)
-    res_2 = sum(gamma[i, 0] * (i + 1) / nrofcoup for i in range(0, m))
-    res_3 = sum(gamma[i, 0] * np.sinh(alfa * (i + 1) / nrofcoup) for i in range(0, m))
+    gamma = np.zeros(alfa.shape + (m, 1))
+    gamma[..., payoffs, :] = gamma_payoffs
+    res_2 = np.sum(gamma_payoffs[..., 0] * u, axis=-1)
+    res_3 = np.sum(gamma_payoffs[..., 0] * np.sinh(alfa[..., None] * u), axis=-1)
     kappa = (1 + alfa * res_2) / res_3
     return (alfa / np.abs(1 - kappa * np.exp(t2 * alfa)) - tau, gamma)
 
 
+def _bracket_root(
+    func, lo: float, hi: float, f_hi: float, method: str, tol: float, max_iter: int
+) -> tuple:
+    """
+    Narrows a sign change of func down to an interval of width tol.
+
+    Args:
+        func (callable): Function of alfa, positive at lo and non-positive at hi.
+        lo (float): Lower end of the bracket.
+        hi (float): Upper end of the bracket.
+        f_hi (float): Value of func at hi.
+        method (str): Either "bisection" or "brentq".
+        tol (float): Absolute tolerance on the width of the final bracket.
+        max_iter (int): Maximum number of function evaluations.
+
+    Returns:
+        tuple: The final bracket (lo, hi) with func(lo) > 0 >= func(hi).
+    """
+    if method == "bisection":
+        for _ in range(max_iter):
+            if hi - lo <= tol:
+                break
+            mid = (lo + hi) / 2
+            if func(mid) > 0:
+                lo = mid
+            else:
+                hi = mid
+        return (lo, hi)
+
+    # Brent's method as in the brentq routine of scipy, keeping track of the
+    # point xblk at the other side of the sign change of xcur
+    xpre, xcur = lo, hi
+    fpre, fcur = func(lo), f_hi
+    xblk, fblk, spre, scur = 0.0, 0.0, 0.0, 0.0
+    for _ in range(max_iter):
+        if fpre * fcur < 0:
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+        delta = tol / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0 or abs(sbis) < delta:
+            break
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # interpolate
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # extrapolate
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = (
+                    -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+                )
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+        xpre, fpre = xcur, fcur
+        if abs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0 else -delta
+        fcur = func(xcur)
+    if fcur > 0:
+        return (xcur, xblk)
+    elif fcur < 0:
+        return (xblk, xcur)
+    return (xcur - tol, xcur)
+
+
+def _round_up_alfa(
+    alfa: float,
+    lo: float,
+    hi: float,
+    f_hi: float,
+    gap,
+    q: np.array,
+    nrofcoup: float,
+    t2: float,
+    tau: float,
+    precision: int,
+    method: str,
+    tol: float,
+) -> tuple:
+    """
+    Narrows down a bracket of the sign change of the gap with a root finder
+    and rounds up to the first alfa on the grid of the scan-procedure,
+    starting at alfa with steps of precision decimals, for which the gap is
+    non-positive.
+
+    Returns:
+        tuple: A tuple containing the optimal alfa value and the corresponding gamma value.
+    """
+    stepsize = 0.1**precision
+    lo, hi = _bracket_root(gap, lo, hi, f_hi, method, tol, max_iter=100)
+    k = np.floor((lo - alfa) / stepsize) + 1
+    new_alfa, gamma = big_g(alfa + k * stepsize, q, nrofcoup, t2, tau)
+    while new_alfa > 0:
+        k += 1
+        new_alfa, gamma = big_g(alfa + k * stepsize, q, nrofcoup, t2, tau)
+    return (alfa + k * stepsize, gamma)
+
+
+def _scan(
+    candidates: list, q: np.array, nrofcoup: float, t2: float, tau: float
+) -> tuple:
+    """
+    Evaluates big_g for a list of increasing alfa candidates at once.
+
+    Args:
+        candidates (list): Alfa candidates.
+        q (np.array): Input array for q.
+        nrofcoup (float): Number of coupons.
+        t2 (float): T2 value.
+        tau (float): Tau value.
+
+    Returns:
+        tuple: The first candidate with a non-positive gap (or the last
+            candidate if there is none), its gamma and whether it was found.
+    """
+    gaps, gammas = big_g(np.array(candidates), q, nrofcoup, t2, tau)
+    non_positive = np.flatnonzero(gaps <= 0)
+    i = non_positive[0] if non_positive.size > 0 else len(candidates) - 1
+    return (candidates[i], gammas[i], non_positive.size > 0)
+
+
 def optimal_alfa(
-    alfa: float, q: float, nrofcoup: float, t2: float, tau: float, precision: float
+    alfa: float,
+    q: float,
+    nrofcoup: float,
+    t2: float,
+    tau: float,
+    precision: float,
+    method: str = "brute_force",
+    tol: float = None,
+    warm_start: float = None,
 ) -> tuple:
     """
     Finds the optimal alfa value based on the given parameters and precision.
 
+    With method "brute_force" the alfa is found with the scan-procedure of
+    the EIOPA production code. With method "brentq" or "bisection" the sign
+    change of the gap function is bracketed and narrowed down with a root
+    finder, after which the alfa is rounded up to the same grid of
+    precision decimals as the scan-procedure, so both give the same alfa.
+
+    With a warm_start, the alfa of an earlier calibration, the gap is
+    evaluated at a few grid points around that alfa with one call of big_g,
+    followed by secant steps on the grid, each again with one call, until the
+    sign change lies between two evaluated grid points. If that fails after
+    a few steps the sign change is bracketed and narrowed down with brentq
+    (or bisection). For a parallel shift of the rates of a few basis points
+    this takes three calls of big_g instead of about ten, which roughly
+    halves the time of optimal_alfa; for larger changes the gain vanishes.
+
     Args:
         alfa (float): Initial alfa value.
         q (float): Input value for q.
@@ -82,6 +282,11 @@ def optimal_alfa(
         t2 (float): T2 value.
         tau (float): Tau value.
         precision (float): Precision level for finding the optimal alfa.
+        method (str): "brute_force", "brentq" or "bisection". Default is "brute_force".
+        tol (float): Absolute tolerance of the root finder, at most one tenth
+            of the last decimal of precision. Default is None, which means one
+            tenth of the last decimal of precision.
+        warm_start (float): Alfa of an earlier calibration. Default is None.
 
     Returns:
         tuple: A tuple containing the optimal alfa value and the corresponding gamma value.
@@ -97,28 +302,128 @@ def optimal_alfa(
         (0.09999999999999999, array([[-0.07812712],
                [-0.30490089]]))
     """
+    assert method in [
+        "brute_force",
+        "brentq",
+        "bisection",
+    ], "method should be brute_force, brentq or bisection."
+
+    stepsize = 0.1**precision
+    if tol is None or tol > stepsize / 10:
+        # the alfa is rounded up to the grid, a coarser tolerance only adds
+        # evaluations of the gap on the grid
+        tol = stepsize / 10
+
+    def gap(x):
+        return big_g(x, q, nrofcoup, t2, tau)[0]
+
+    if warm_start is not None and np.round((warm_start - alfa) / stepsize) > 0:
+        # start at the earlier alfa on the grid of the scan-procedure; the
+        # gaps at a few grid points are evaluated with one call of big_g
+        gaps = {}
+
+        def evaluate(points):
+            points = [i for i in points if i not in gaps and i >= 0]
+            values, gammas = big_g(
+                alfa + np.array(points) * stepsize, q, nrofcoup, t2, tau
+            )
+            for i, value, gamma in zip(points, values, gammas):
+                gaps[i] = (value, gamma)
+
+        k = np.round((warm_start - alfa) / stepsize)
+        evaluate([k - 1, k, k + 1])
+        slope = (gaps[k + 1][0] - gaps[k - 1][0]) / 2
+        for _ in range(4):
+            # the alfa is the first grid point with a non-positive gap
+            found = [i for i in sorted(gaps) if gaps[i][0] <= 0]
+            if found and found[0] == 0:
+                return (alfa, gaps[0][1])
+            if found and found[0] - 1 in gaps and gaps[found[0] - 1][0] > 0:
+                return (alfa + found[0] * stepsize, gaps[found[0]][1])
+            if slope == 0:
+                break
+            # secant step, with the slope between the two points furthest
+            # apart to be robust against the curvature of the gap
+            i = max(np.ceil(k - gaps[k][0] / slope), 1)
+            evaluate([i - 2, i - 1, i, i + 1])
+            slope = (gaps[i][0] - gaps[k][0]) / (i - k) if i != k else slope
+            k = i
+        pos = [i for i in gaps if gaps[i][0] > 0]
+        neg = [i for i in gaps if gaps[i][0] <= 0]
+        if neg and [i for i in pos if i < min(neg)]:
+            hi = min(neg)
+            lo = max([i for i in pos if i < hi])
+            lo, hi, f_hi = alfa + lo * stepsize, alfa + hi * stepsize, gaps[hi][0]
+        elif neg:
+            # bracket the sign change below the earlier alfa
+            hi = alfa + min(neg) * stepsize
+            f_hi, width = gaps[min(neg)][0], 0.01
+            lo = max(hi - width, alfa)
+            f_lo = gap(lo)
+            while f_lo <= 0:
+                if lo == alfa:
+                    return (alfa, big_g(alfa, q, nrofcoup, t2, tau)[1])
+                hi, f_hi, width = lo, f_lo, 2 * width
+                lo = max(hi - width, alfa)
+                f_lo = gap(lo)
+        else:
+            # bracket the sign change above the earlier alfa
+            lo, width = alfa + max(pos) * stepsize, 0.01
+            hi = lo + width
+            f_hi = gap(hi)
+            while f_hi > 0:
+                if width > 100:
+                    raise ValueError(
+                        "No sign change of the gap function found for alfa."
+                    )
+                lo, width = hi, 2 * width
+                hi = lo + width
+                f_hi = gap(hi)
+        if method == "brute_force":
+            method = "brentq"
+        return _round_up_alfa(
+            alfa, lo, hi, f_hi, gap, q, nrofcoup, t2, tau, precision, method, tol
+        )
+
     new_alfa, gamma = big_g(alfa, q, nrofcoup, t2, tau)
-    if new_alfa > 0:
+    if new_alfa > 0 and method == "brute_force":
         # scanning for the optimal alfa is based on the scan-procedure taken
         # from Eiopa matlab production code in each for-next loop the next
         # optimal alfa decimal is scanned for, starting with an stepsize
         # of 0.1 (first decimal) followed by the a next decimal through
         # stepsize = stepsize/10
+        # The candidates of each scan are evaluated with one call of big_g
         stepsize = 0.1
         #        for alfa in range(alfamin + stepsize, 20, stepsize):
-        for i in range(0, 200):
-            alfa = alfa + stepsize + i / 10
-            new_alfa, gamma = big_g(alfa, q, nrofcoup, t2, tau)
-            if new_alfa <= 0:
+        candidates = []
+        for i in range(1, 201):
+            candidates.append(alfa + i * stepsize)
+        for i in range(0, 200, 10):
+            alfa, gamma, found = _scan(candidates[i : i + 10], q, nrofcoup, t2, tau)
+            if found:
                 break
         for i in range(0, precision - 1):
             alfa = alfa - stepsize
+            candidates = []
             for i in range(1, 11):
                 alfa = alfa + stepsize / 10
-                new_alfa, gamma = big_g(alfa, q, nrofcoup, t2, tau)
-                if new_alfa <= 0:
-                    break
+                candidates.append(alfa)
+            alfa, gamma, found = _scan(candidates, q, nrofcoup, t2, tau)
             stepsize = stepsize / 10
+    elif new_alfa > 0:
+        # bracket the sign change by doubling the width of the interval
+        lo, width = alfa, 0.1
+        hi = lo + width
+        f_hi = gap(hi)
+        while f_hi > 0:
+            if width > 100:
+                raise ValueError("No sign change of the gap function found for alfa.")
+            lo, width = hi, 2 * width
+            hi = lo + width
+            f_hi = gap(hi)
+        alfa, gamma = _round_up_alfa(
+            alfa, lo, hi, f_hi, gap, q, nrofcoup, t2, tau, precision, method, tol
+        )
     return (alfa, gamma)
 
 
@@ -147,8 +452,8 @@ def q_matrix(
         n (int): Number of rows for the Q matrix.
         m (int): Number of columns for the Q matrix.
         liquid_maturities (int): Liquid maturities.
-        RatesIn (np.array): Input array for RatesIn.
-        nrofcoup (float): Number of coupons.
+        RatesIn (np.array): Input array for RatesIn, indexed by maturity.
+        nrofcoup (float): Number of coupons per year.
         cra (float): CRA value.
         log_ufr (float): Log UFR value.
 
@@ -156,41 +461,447 @@ def q_matrix(
         np.array: The Q matrix.
 
     Example:
-        >>> instrument = "Zero"
-        >>> n = 5
-        >>> m = 10
-        >>> liquid_maturities = [1, 2, 3, 4, 5]
-        >>> RatesIn = np.array([0.02, 0.025, 0.03, 0.035, 0.04, 0.045, 0.05, 0.055, 0.06, 0.065])
+        >>> instrument = "Swap"
+        >>> n = 2
+        >>> m = 6
+        >>> liquid_maturities = [1, 3]
+        >>> RatesIn = {1: 0.02, 3: 0.03}
         >>> nrofcoup = 2
-        >>> cra = 0.01
-        >>> log_ufr = 0.05
+        >>> cra = 0.001
+        >>> log_ufr = 0.03
         >>> q_matrix(instrument, n, m, liquid_maturities, RatesIn, nrofcoup, cra, log_ufr)
-        array([[0.98212276, 0.96306662, 0.9434712 , 0.92329604, 0.90249446,
-                0.88101278, 0.85879177, 0.83576508, 0.81185891, 0.78699164],
-               [0.96147922, 0.92493439, 0.89089811, 0.85915296, 0.8294894 ,
-                0.80171838, 0.7756698 , 0.75118792, 0.7281295 , 0.70636475],
-               [0.94115884, 0.88886852, 0.84156022, 0.79889855, 0.76055566,
-                0.72622884, 0.6956359 , 0.66851953, 0.64464666, 0.6238033 ],
-               [0.92115253, 0.85321133, 0.79353918, 0.74081822, 0.69373509,
-                0.65182761, 0.61455512, 0.58132809, 0.55153767, 0.52460095],
-               [0.90145167, 0.81806971, 0.74818245, 0.68630865, 0.6314886 ,
-                0.58232972, 0.53795468, 0.497996  , 0.4623893 , 0.43049448]])
+        array([[0.00935856, 0.97966477, 0.        , 0.        , 0.        ,
+                0.        ],
+               [0.01428412, 0.01407146, 0.01386196, 0.01365559, 0.01345228,
+                0.92718319]])
     """
     q = np.zeros([n, m])
+    u = np.asarray(liquid_maturities)
+    rates = np.array([RatesIn[i] for i in liquid_maturities], dtype="float64")
+    # column of the final pay-off of each instrument at time u(i)
+    last = np.rint(u * nrofcoup).astype(int) - 1
     if instrument == "Zero":
-        for i, u in enumerate(liquid_maturities):
-            q[i, u - 1] = np.exp(-log_ufr * u) * np.power(1 + RatesIn[u] - cra, u)
-    #    elif instrument == "Swap" or instrument == "Bond":
-    # not yet correct
-    #        for i in range(0, n):
-    #            for j in range(1, u[i] * nrofcoup - 1):
-    #                q[i, j] = np.exp(-log_ufr * j / nrofcoup) * (r[i] - cra)
-    #                               / nrofcoup
-    #            q[i, j] = np.exp(-log_ufr * j / nrofcoup) * (1 + (r[i] - cra)
-    #                               / nrofcoup)
+        q[np.arange(n), last] = np.exp(-log_ufr * u) * np.power(1 + rates - cra, u)
+    elif instrument == "Swap" or instrument == "Bond":
+        # coupons of r(i)/nrofcoup at all times up to and including u(i),
+        # plus the notional of 1 at time u(i)
+        j = np.arange(1, m + 1)
+        q = np.where(
+            j <= last[:, None] + 1,
+            np.exp(-log_ufr * j / nrofcoup) * (rates[:, None] - cra) / nrofcoup,
+            0,
+        )
+        q[np.arange(n), last] += np.exp(-log_ufr * u)
     return q
 
 
+def _q_matrix_derivative(
+    instrument: str,
+    n: int,
+    m: int,
+    liquid_maturities: int,
+    RatesIn: np.array,
+    nrofcoup: float,
+    cra: float,
+    log_ufr: float,
+) -> np.array:
+    """
+    Constructs the derivative of each row of the Q matrix to the rate of its
+    instrument, with the same arguments as q_matrix.
+
+    Returns:
+        np.array: The derivative of the Q matrix.
+    """
+    dq = np.zeros([n, m])
+    u = np.asarray(liquid_maturities)
+    rates = np.array([RatesIn[i] for i in liquid_maturities], dtype="float64")
+    last = np.rint(u * nrofcoup).astype(int) - 1
+    if instrument == "Zero":
+        dq[np.arange(n), last] = (
+            np.exp(-log_ufr * u) * u * np.power(1 + rates - cra, u - 1)
+        )
+    elif instrument == "Swap" or instrument == "Bond":
+        j = np.arange(1, m + 1)
+        dq = np.where(
+            j <= last[:, None] + 1, np.exp(-log_ufr * j / nrofcoup) / nrofcoup, 0
+        )
+    return dq
+
+
+class SmithWilsonCurve(object):
+    """
+    Calibrated Smith-Wilson curve that can be evaluated at any maturities.
+
+    The curve is calibrated once and can then be evaluated vectorized at
+    arrays of real-valued maturities, for example monthly cash flow dates.
+    The alfa, gamma and ufr may have a leading dimension for a batch of
+    curves, in which case the outputs have shape (curves,) + v.shape.
+
+    Attributes:
+        alfa (float): Alfa value of the curve.
+        gamma (np.array): Gamma vector Qb according to 156 of the specs.
+        maturities (np.array): Cash flow maturities u of the calibration
+            instruments corresponding to gamma.
+        ufr (float): Ultimate Forward Rate annual compounded (perunage).
+
+    Methods:
+        __init__(alfa, gamma, maturities, ufr): Initialize curve object.
+        calibrate(...): Calibrate a curve with the arguments of smith_wilson.
+        discount_rates(v): Discount factors at maturities v.
+        zero_rates(v): Zero rates annual compounding at maturities v.
+        forward_rates(v, period): Forward rates annual compounding at maturities v.
+        forward_intensities(v): Forward intensities at maturities v.
+        yield_intensities(v): Yield intensities at maturities v.
+    """
+
+    def __init__(self, alfa: float, gamma: np.array, maturities: np.array, ufr: float):
+        """
+        Initialize the curve.
+
+        Args:
+            alfa (float): Alfa value of the curve.
+            gamma (np.array): Gamma vector Qb according to 156 of the specs.
+            maturities (np.array): Cash flow maturities u corresponding to gamma.
+            ufr (float): Ultimate Forward Rate annual compounded (perunage).
+
+        Returns:
+            None
+        """
+        self.alfa = alfa
+        self.gamma = np.asarray(gamma, dtype="float64")
+        self.maturities = np.asarray(maturities, dtype="float64")
+        self.ufr = ufr
+        self.log_ufr = np.log(1 + np.asarray(ufr, dtype="float64"))
+
+    @classmethod
+    def calibrate(
+        cls,
+        instrument: str = "Zero",
+        liquid_maturities: list = [],
+        RatesIn: dict = {},
+        nrofcoup: int = 1,
+        cra: float = 0,
+        ufr: float = 0,
+        min_alfa: float = 0.05,
+        tau: float = 1,
+        T2: int = 60,
+        precision: int = 6,
+        method: str = "brute_force",
+        tol: float = None,
+        warm_start=None,
+        cache=None,
+    ):
+        """
+        Calibrates a Smith-Wilson curve.
+
+        A warm_start, the curve (or alfa) of an earlier calibration, speeds
+        up recalibrations on slightly changed rates: the search for alfa
+        starts at the earlier alfa, see optimal_alfa.
+
+        Args:
+            instrument (str): Type of financial instrument. Default is "Zero".
+            liquid_maturities (list): Liquid maturities.
+            RatesIn (dict): Input dictionary for RatesIn.
+            nrofcoup (int): Number of Coupon Payments per Year. Default is 1.
+            cra (float): Credit Risk Adjustment in basispoints. Default is 0.
+            ufr (float): Ultimate Forward Rate annual compounded (perunage). Default is 0.
+            min_alfa (float): Minimum value for alfa. Default is 0.05.
+            tau (float): Tau value. Default is 1.
+            T2 (int): Convergence Maturity. Default is 60.
+            precision (int): Precision value. Default is 6.
+            method (str): Calculation method for alfa, "brute_force", "brentq"
+                or "bisection". Default is "brute_force".
+            tol (float): Absolute tolerance for the methods "brentq" and
+                "bisection". Default is None.
+            warm_start (SmithWilsonCurve or float): Curve or alfa of an
+                earlier calibration. Default is None.
+            cache (LRUCache): Cache of calibrated curves, keyed on a hash of
+                the inputs, of which copies are returned. Default is None,
+                which means no caching.
+
+        Returns:
+            SmithWilsonCurve: The calibrated curve.
+
+        Example:
+            >>> liquid_maturities = [1, 2, 3, 5, 10]
+            >>> RatesIn = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+            >>> curve = SmithWilsonCurve.calibrate("Zero", liquid_maturities, RatesIn, ufr=0.036)
+            >>> curve.zero_rates([0.5, 10, 150])
+            array([0.00930388, 0.02      , 0.03415156])
+        """
+        assert instrument in [
+            "Zero",
+            "Swap",
+            "Bond",
+        ], "instrument should be Zero, Swap or Bond."
+
+        if cache is not None:
+            # a warm start finds the alfa with a root finder
+            if warm_start is not None and method == "brute_force":
+                key_method = "brentq"
+            else:
+                key_method = method
+            key = hash_key(
+                instrument,
+                list(liquid_maturities),
+                [RatesIn[i] for i in liquid_maturities],
+                nrofcoup,
+                cra,
+                ufr,
+                min_alfa,
+                tau,
+                T2,
+                precision,
+                key_method,
+                tol,
+            )
+            # the cache holds its own copy, so changes to the returned curve
+            # do not end up in later lookups
+            curve = cache.get(key)
+            if curve is not None:
+                return copy.deepcopy(curve)
+            curve = cls.calibrate(
+                instrument,
+                liquid_maturities,
+                RatesIn,
+                nrofcoup,
+                cra,
+                ufr,
+                min_alfa,
+                tau,
+                T2,
+                precision,
+                method,
+                tol,
+                warm_start,
+            )
+            cache.put(key, copy.deepcopy(curve))
+            return curve
+
+        # the number of liquid rates
+        n = len(liquid_maturities)
+        # nrofcoup * maximum liquid maturity
+        m = nrofcoup * max(liquid_maturities)
+
+        log_ufr = np.log(1 + ufr)
+        tau = tau / 10000
+        cra = cra / 10000
+
+        # Q' matrix according to 146 of specs;
+        q = q_matrix(
+            instrument, n, m, liquid_maturities, RatesIn, nrofcoup, cra, log_ufr
+        )
+
+        # only cash flow maturities with pay-offs contribute to the curve
+        payoffs = np.any(q != 0, axis=0)
+        maturities = np.arange(1, m + 1)[payoffs] / nrofcoup
+
+        if isinstance(warm_start, SmithWilsonCurve):
+            warm_start = warm_start.alfa
+
+        # Determine optimal alfa with corresponding gamma
+        alfa, gamma = optimal_alfa(
+            min_alfa, q, nrofcoup, T2, tau, precision, method, tol, warm_start
+        )
+        alfa = np.round(alfa, 6)
+
+        return cls(alfa, gamma[payoffs, 0], maturities, ufr)
+
+    def _expand(self, x: np.array, v: np.array) -> np.array:
+        """
+        Appends an axis to x for each dimension of v.
+        """
+        return np.asarray(x, dtype="float64")[(Ellipsis,) + (None,) * v.ndim]
+
+    def _kernels(self, v: np.array) -> tuple:
+        """
+        Calculates H(v,u)*Qb according to 154 and G(v,u)*Qb according to 158
+        of the specs, in chunks of maturities v to limit memory use.
+
+        Args:
+            v (np.array): Maturities.
+
+        Returns:
+            tuple: H(v,u)*Qb and G(v,u)*Qb.
+        """
+        alfa = np.asarray(self.alfa, dtype="float64")[..., None, None]
+        gamma = self.gamma[..., None]
+        u = self.maturities
+        flat_v = v.reshape(-1)
+        batch = np.broadcast_shapes(alfa.shape[:-2], gamma.shape[:-2])
+        temp_discount = np.empty(batch + flat_v.shape)
+        temp_intensity = np.empty(batch + flat_v.shape)
+        chunk = max(1, 2**20 // (u.size * max(1, int(np.prod(batch)))))
+        for start in range(0, flat_v.size, chunk):
+            w = flat_v[start : start + chunk, None]
+            # The H(v,u) matrix according to 139 and the G(v,u) matrix
+            # according to 142 of the technical specs
+            h = big_h(alfa * w, alfa * u)
+            g = np.where(
+                u > w,
+                alfa * (1 - np.exp(-alfa * u) * np.cosh(alfa * np.minimum(w, u))),
+                alfa * np.exp(-alfa * w) * np.sinh(alfa * u),
+            )
+            temp_discount[..., start : start + chunk] = np.matmul(h, gamma)[..., 0]
+            temp_intensity[..., start : start + chunk] = np.matmul(g, gamma)[..., 0]
+        shape = batch + v.shape
+        return temp_discount.reshape(shape), temp_intensity.reshape(shape)
+
+    def discount_rates(self, v: np.array) -> np.array:
+        """
+        Calculates the discount factors according to 154 of the specs.
+
+        Args:
+            v (np.array): Maturities.
+
+        Returns:
+            np.array: Discount factors at maturities v.
+        """
+        v = np.asarray(v, dtype="float64")
+        temp_discount = self._kernels(v)[0]
+        return np.exp(-self._expand(self.log_ufr, v) * v) * (1 + temp_discount)
+
+    def yield_intensities(self, v: np.array) -> np.array:
+        """
+        Calculates the yield intensities according to 158 of the specs, and
+        according to 160 of the specs for maturity 0.
+
+        Args:
+            v (np.array): Maturities.
+
+        Returns:
+            np.array: Yield intensities at maturities v.
+        """
+        v = np.asarray(v, dtype="float64")
+        log_ufr = self._expand(self.log_ufr, v)
+        temp_discount = self._kernels(v)[0]
+        intensity_0 = self._expand(self.forward_intensities(0), v)
+        return np.where(
+            v > 0,
+            log_ufr - np.log(1 + temp_discount) / np.where(v > 0, v, 1),
+            intensity_0,
+        )
+
+    def forward_intensities(self, v: np.array) -> np.array:
+        """
+        Calculates the forward intensities according to 158 of the specs.
+
+        Args:
+            v (np.array): Maturities.
+
+        Returns:
+            np.array: Forward intensities at maturities v.
+        """
+        v = np.asarray(v, dtype="float64")
+        temp_discount, temp_intensity = self._kernels(v)
+        return self._expand(self.log_ufr, v) - temp_intensity / (1 + temp_discount)
+
+    def zero_rates(self, v: np.array) -> np.array:
+        """
+        Calculates the zero rates annual compounding.
+
+        Args:
+            v (np.array): Maturities.
+
+        Returns:
+            np.array: Zero rates at maturities v.
+        """
+        return np.exp(self.yield_intensities(v)) - 1
+
+    def forward_rates(self, v: np.array, period: float = 1) -> np.array:
+        """
+        Calculates the forward rates annual compounding over the period
+        ending at maturities v. For maturities shorter than period, the
+        forward rate starts at maturity 0.
+
+        Args:
+            v (np.array): Maturities.
+            period (float): Length of the forward period in years. Default is 1.
+
+        Returns:
+            np.array: Forward rates at maturities v.
+        """
+        v = np.asarray(v, dtype="float64")
+        length = np.minimum(v, period)
+        ratio = self.discount_rates(v - length) / self.discount_rates(v)
+        return np.where(
+            length > 0,
+            np.power(ratio, 1 / np.where(length > 0, length, 1)) - 1,
+            np.exp(self.forward_intensities(v)) - 1,
+        )
+
+
+def _output_maturities(
+    max_maturity: float = 120, step: float = 1, maturities: np.array = None
+) -> np.array:
+    """
+    Constructs the grid of output maturities.
+
+    Args:
+        max_maturity (float): Maximum output maturity. Default is 120.
+        step (float): Step between the output maturities. Default is 1.
+        maturities (np.array): Explicit output maturities, in increasing
+            order starting at 0, instead of max_maturity and step.
+            Default is None.
+
+    Returns:
+        np.array: The output maturities.
+
+    Example:
+        >>> _output_maturities(1, 0.25)
+        array([0.  , 0.25, 0.5 , 0.75, 1.  ])
+    """
+    if maturities is not None:
+        v = np.asarray(maturities, dtype="float64")
+        assert v.ndim == 1 and v[0] == 0, "maturities should start at 0."
+        assert np.all(np.diff(v) > 0), "maturities should be increasing."
+        return v
+    assert step > 0, "step should be positive."
+    return np.arange(0, int(np.round(max_maturity / step)) + 1) * float(step)
+
+
+def _sw_outputs(curve: SmithWilsonCurve, v: np.array) -> dict:
+    """
+    Calculates the Smith-Wilson output curves for the maturity grid v.
+
+    Args:
+        curve (SmithWilsonCurve): Calibrated curve.
+        v (np.array): Output maturities, in increasing order starting at 0.
+
+    Returns:
+        dict: The output curves, keyed by output_type of smith_wilson.
+    """
+    v = np.asarray(v, dtype="float64")
+    log_ufr = curve._expand(curve.log_ufr, v)
+    temp_discount, temp_intensity = curve._kernels(v)
+
+    discount = np.exp(-log_ufr * v) * (1 + temp_discount)
+
+    # yield intensities according to 158 of the specs and for maturity 0
+    # according to 160 of the specs, which equals the forward intensity
+    fwintensity = log_ufr - temp_intensity / (1 + temp_discount)
+    yldintensity = np.empty_like(fwintensity)
+    yldintensity[..., 0] = fwintensity[..., 0]
+    yldintensity[..., 1:] = log_ufr - np.log(1 + temp_discount[..., 1:]) / v[1:]
+
+    # forward rates between two consecutive maturities of the grid
+    forwardac = np.zeros_like(discount)
+    forwardac[..., 1:] = (
+        np.power(discount[..., :-1] / discount[..., 1:], 1 / np.diff(v)) - 1
+    )
+
+    zeroac = np.zeros_like(discount)
+    zeroac[..., 1:] = np.power(discount[..., 1:], -1 / v[1:]) - 1
+
+    return {
+        "zero rates annual compounding": zeroac,
+        "forward rate annual compounding": forwardac,
+        "discount rates": discount,
+        "forward intensities": fwintensity,
+        "yield intensities": yldintensity,
+    }
+
+
 def smith_wilson(
     instrument: str = "Zero",
     liquid_maturities: list = [],
@@ -204,6 +915,12 @@ def smith_wilson(
     precision: int = 6,
     method: str = "brute_force",
     output_type: str = "zero rates annual compounding",
+    tol: float = None,
+    warm_start=None,
+    cache=None,
+    max_maturity: float = 120,
+    step: float = 1,
+    maturities: np.array = None,
 ):
     """
     Calculates Smith-Wilson parameters and returns output based on the specified parameters.
@@ -226,8 +943,25 @@ def smith_wilson(
         tau (float): Tau value. Default is 1.
         T2 (int): Convergence Maturity. Default is 60.
         precision (int): Precision value. Default is 6.
-        method (str): Calculation method. Default is "brute_force".
-        output_type (str): Type of output. Default is "zero rates annual compounding".
+        method (str): Calculation method for alfa, "brute_force", "brentq"
+            or "bisection". Default is "brute_force".
+        tol (float): Absolute tolerance for the methods "brentq" and
+            "bisection". Default is None.
+        output_type (str): Type of output, "zero rates annual compounding",
+            "forward rate annual compounding", "discount rates", "forward intensities",
+            "yield intensities", "alfa" or "all" for a SmithWilsonOutput
+            with all of them. Default is "zero rates annual compounding".
+        warm_start (SmithWilsonCurve or float): Curve or alfa of an earlier
+            calibration to start the search for alfa from, see
+            SmithWilsonCurve.calibrate. Default is None.
+        cache (LRUCache): Cache of calibrated curves to look up repeated
+            calibrations in. Default is None, which means no caching.
+        max_maturity (float): Maximum output maturity. Default is 120.
+        step (float): Step between the output maturities, for example 1 / 12
+            for monthly maturities. Default is 1.
+        maturities (np.array): Explicit output maturities, in increasing
+            order starting at 0, instead of max_maturity and step.
+            Default is None.
 
     Returns:
         output: Calculated output based on the specified parameters.
@@ -246,117 +980,58 @@ def smith_wilson(
         >>> method = "brute_force"
         >>> output_type = "zero rates annual compounding"
         >>> smith_wilson(instrument, liquid_maturities, RatesIn, nrofcoup, cra, ufr, min_alfa, tau, T2, precision, method, output_type)
-        array([0.        , 0.01984642, 0.04040711, 0.06171705, 0.08381221,
-               0.10672926, 0.13050535, 0.15517806, 0.18078504, 0.20736481,
-               0.23495648, 0.26360038, 0.29333873, 0.3242144 , 0.35627157,
-               0.3895553 , 0.42411294, 0.4599934 , 0.49724737, 0.53592752,
-               0.57608986, 0.61779295, 0.66109833, 0.70607181, 0.75278461,
-               0.80131366, 0.85174183, 0.90415729, 0.95865366, 1.01533039,
-               1.0742924 , 1.13564943, 1.19951555, 1.26601055, 1.33526045,
-               1.40739786, 1.48256135, 1.5608958 , 1.6425528 , 1.72769014,
-               1.81647324, 1.90907556, 2.00567914, 2.10647707, 2.21167306,
-               2.32148215, 2.43613139, 2.55586064, 2.68092039, 2.81157657,
-               2.94810739, 3.09080731, 3.23998602, 3.39596949, 3.559099  ,
-               3.72973118, 3.90823814, 4.09500861, 4.29045285, 4.49400082,
-               4.70510529, 4.92324198, 5.14791281, 5.37864303, 5.61498852,
-               5.85652901, 6.10287445, 6.35366537, 6.6085712 , 6.86728774,
-               7.12954064, 7.395082  , 7.66368905, 7.93516083, 8.20931788,
-               8.48599994, 8.76506649, 9.04639664, 9.329887  , 9.61545067,
-               9.90301596, 10.19252555, 10.48393262, 10.77720086, 11.07230382,
-               11.36922416, 11.66795383, 11.96849432, 12.27085209, 12.57503994,
-               12.88007745, 13.18599135, 13.49281377, 13.80058263, 14.109341  ,
-               14.41913647, 14.73002158, 15.04205535, 15.35530365, 15.66983964,
-               15.98574325, 16.30310069, 16.62199494, 16.94251238, 17.2647438 ,
-               17.5887832 , 17.91472858, 18.24268076, 18.5727421 , 18.90502131,
-               19.23963426, 19.57670285, 19.9163558 , 20.25872748, 20.60395864,
-               20.95219615, 21.30359381, 21.65831201, 22.01651854, 22.3783874 ])
-    """
-    assert (
-        instrument == "Zero" and nrofcoup == 1
-    ), "instrument is zero bond, but with nrofcoup unequal to 1."
-    assert method == "brute_force", "Only brute force method is implemented."
-    assert instrument == "Zero", "No other instruments implemented yet."
-
-    # the number of liquid rates
-    n = len(liquid_maturities)
-    # nrofcoup * maximum liquid maturity
-    m = nrofcoup * max(liquid_maturities)
-
-    log_ufr = np.log(1 + ufr)
-    tau = tau / 10000
-    cra = cra / 10000
-
-    # Q' matrix according to 146 of specs;
-    q = q_matrix(instrument, n, m, liquid_maturities, RatesIn, nrofcoup, cra, log_ufr)
-
-    # Determine optimal alfa with corresponding gamma
-    if method == "brute_force":
-        alfa, gamma = optimal_alfa(min_alfa, q, nrofcoup, T2, tau, precision)
-    alfa = np.round(alfa, 6)
-
-    # Now the SW-present value function according to 154 of the specs can be
-    # calculated: p(v)=exp(-lnUFR*v)*(1+H(v,u)*Qb)
-    # The G(v,u) matrix for maturities v = 1 to 121 according to 142 of the
-    # technical specs (Note: maturity 121 will not be used; see later)
-    g = np.fromfunction(
-        lambda i, j: np.where(
-            j / nrofcoup > i,
-            alfa * (1 - np.exp(-alfa * j / nrofcoup) * np.cosh(alfa * i)),
-            alfa * np.exp(-alfa * i) * np.sinh(alfa * j / nrofcoup),
-        ),
-        (121, m),
-    )
-
-    # The H(v,u) matrix for maturities v = 1 to 121 according to 139
-    # of the technical specs
-    # h[i, j] = big_h(alfa * i, alfa * (j+1) / nrofcoup) -> strange,
-    # is different from earlier def
-    h = np.fromfunction(
-        lambda i, j: big_h(alfa * i / nrofcoup, alfa * (j + 1) / nrofcoup), (122, m)
-    )
-
-    # First a temporary discount-vector will be used to store the in-between
-    # result H(v,u)*Qb = #(v,u)*gamma (see 154 of the specs)
-    temptempdiscount = np.matmul(h, gamma)
-    # Calculating G(v,u)*Qb according to 158 of the specs
-    temptempintensity = np.matmul(g, gamma)
-
-    tempdiscount = np.zeros(121)
-    tempintensity = np.zeros(121)
-    for i in range(0, 121):
-        tempdiscount[i] = temptempdiscount[i][0]
-        tempintensity[i] = temptempintensity[i][0]
-
-    # calculating (1'-exp(-alfa*u'))Qb as subresult for 160 of specs
-    res1 = sum(
-        (1 - np.exp(-alfa * (i + 1) / nrofcoup)) * gamma[i, 0] for i in range(0, m)
+        array([0.        , 0.024999  , 0.029999  , 0.034999  , 0.039999  ,
+               0.044999  , 0.04852595, 0.05087246, 0.05248826, 0.05362424,
+               0.05443121, 0.05500512, 0.0554098 , 0.05568922, 0.05587459,
+               0.05598858, 0.05604796, 0.05606537, 0.05605046, 0.05601066,
+               0.05595178, 0.05587836, 0.055794  , 0.05570155, 0.05560327,
+               0.05550098, 0.05539612, 0.05528986, 0.0551831 , 0.05507659,
+               0.05497091, 0.05486651, 0.05476374, 0.05466288, 0.05456414,
+               0.05446765, 0.05437353, 0.05428186, 0.05419265, 0.05410594,
+               0.05402172, 0.05393996, 0.05386064, 0.05378372, 0.05370914,
+               0.05363686, 0.05356681, 0.05349893, 0.05343316, 0.05336943,
+               0.05330768, 0.05324784, 0.05318985, 0.05313365, 0.05307916,
+               0.05302634, 0.05297511, 0.05292542, 0.05287722, 0.05283045,
+               0.05278505, 0.05274098, 0.05269819, 0.05265662, 0.05261624,
+               0.05257699, 0.05253884, 0.05250175, 0.05246567, 0.05243057,
+               0.05239642, 0.05236317, 0.0523308 , 0.05229927, 0.05226856,
+               0.05223863, 0.05220946, 0.05218102, 0.05215328, 0.05212622,
+               0.05209982, 0.05207405, 0.0520489 , 0.05202434, 0.05200035,
+               0.05197691, 0.05195401, 0.05193163, 0.05190974, 0.05188834,
+               0.05186741, 0.05184693, 0.0518269 , 0.05180729, 0.05178809,
+               0.05176929, 0.05175088, 0.05173285, 0.05171519, 0.05169787,
+               0.0516809 , 0.05166427, 0.05164796, 0.05163197, 0.05161628,
+               0.05160089, 0.05158579, 0.05157097, 0.05155642, 0.05154214,
+               0.05152812, 0.05151435, 0.05150083, 0.05148754, 0.05147449,
+               0.05146166, 0.05144906, 0.05143667, 0.05142449, 0.05141251,
+               0.05140074])
+    """
+    curve = SmithWilsonCurve.calibrate(
+        instrument,
+        liquid_maturities,
+        RatesIn,
+        nrofcoup,
+        cra,
+        ufr,
+        min_alfa,
+        tau,
+        T2,
+        precision,
+        method,
+        tol,
+        warm_start,
+        cache,
     )
+    alfa = curve.alfa
 
-    # yield intensities
-    yldintensity = np.zeros(121)
-    yldintensity[0] = log_ufr - alfa * res1  # calculating 160 of the specs
-    # calculating 158 of the specs for maturity 1 year
-    yldintensity[1:] = log_ufr - np.log(1 + tempdiscount[1:]) / np.arange(1, 121)
-
-    # forward intensities # calculating 158 of the specs for higher maturities
-    fwintensity = np.zeros(121)
-    fwintensity[0] = log_ufr - alfa * res1  # calculating 160 of the specs
-    fwintensity[1:] = log_ufr - tempintensity[1:] / (1 + tempdiscount[1:])
-
-    # discount rates
-    discount = np.zeros(121)
-    discount[0] = 1
-    discount[1:] = np.exp(-log_ufr * np.arange(1, 121)) * (1 + tempdiscount[1:])
-
-    # forward rates annual compounding
-    forwardac = np.zeros(121)
-    forwardac[0] = 0
-    forwardac[1:] = discount[:-1] / discount[1:] - 1
-
-    # zero rates annual compounding
-    zeroac = np.zeros(121)
-    zeroac[0] = 0
-    zeroac[1:] = np.power(discount[1:], -1 / np.arange(1, 121)) - 1
+    # Now the SW-present value function according to 154 of the specs can be
+    # calculated for the output maturities, by default v = 0 to 120
+    outputs = _sw_outputs(curve, _output_maturities(max_maturity, step, maturities))
+    zeroac = outputs["zero rates annual compounding"]
+    forwardac = outputs["forward rate annual compounding"]
+    discount = outputs["discount rates"]
+    fwintensity = outputs["forward intensities"]
+    yldintensity = outputs["yield intensities"]
 
     if output_type == "zero rates annual compounding":
         output = zeroac
@@ -370,5 +1045,376 @@ def smith_wilson(
         output = yldintensity
     elif output_type == "alfa":
         output = alfa
+    elif output_type == "all":
+        output = SmithWilsonOutput(
+            zeroac, forwardac, discount, fwintensity, yldintensity, alfa
+        )
 
     return output
+
+
+def _big_g_batch(
+    alfa: np.array,
+    q: np.array,
+    u: np.array,
+    liquid: np.array,
+    t2: np.array,
+    tau: np.array,
+) -> tuple:
+    """
+    Calculates the big g-function for a batch of zero rate curves at once.
+
+    Args:
+        alfa (np.array): Alfa value per curve.
+        q (np.array): Diagonal of the Q matrix with shape (curves, n).
+        u (np.array): Liquid maturities.
+        liquid (np.array): Boolean array with shape (curves, n) of the liquid
+            instruments per curve, non-liquid instruments are left out of the
+            calibration.
+        t2 (np.array): T2 value per curve.
+        tau (np.array): Tau value per curve.
+
+    Returns:
+        tuple: The gap per curve and the gamma vectors with shape (curves, n).
+    """
+    n = u.size
+    # construct the curves*n*n h-tensor, where the rows and columns of
+    # non-liquid instruments are replaced by the identity
+    h = big_h(alfa[:, None, None] * u[:, None], alfa[:, None, None] * u)
+    h = np.where(liquid[:, :, None] & liquid[:, None, :], h, np.eye(n))
+    # gamma = Qb according to 156 of the specs reduces to H^(-1)(Q^(-1)1 - 1)
+    res_1 = np.divide(1, q, out=np.ones_like(q), where=liquid) - 1
+    gamma = np.linalg.solve(h, res_1[..., None])[..., 0]
+    res_2 = np.matmul(gamma, u)
+    res_3 = np.sum(gamma * np.sinh(alfa[:, None] * u), axis=-1)
+    kappa = (1 + alfa * res_2) / res_3
+    return (alfa / np.abs(1 - kappa * np.exp(t2 * alfa)) - tau, gamma)
+
+
+def smith_wilson_batch(
+    liquid_maturities: list = [],
+    RatesIn: np.array = None,
+    cra: np.array = 0,
+    ufr: np.array = 0,
+    llp: np.array = None,
+    min_alfa: float = 0.05,
+    tau: np.array = 1,
+    T2: np.array = 60,
+    precision: int = 6,
+    tol: float = None,
+    output_type: str = "zero rates annual compounding",
+    max_maturity: float = 120,
+    step: float = 1,
+    maturities: np.array = None,
+) -> np.array:
+    """
+    Calculates Smith-Wilson curves for a batch of zero rate curves at once.
+
+    The Q and H tensors of all curves are constructed with broadcasting on
+    the liquid maturities, the linear systems are solved in one batched call
+    and the optimal alfa of all curves is searched for simultaneously by
+    bisection. The alfa of each
+    curve is equal to the alfa of smith_wilson for that curve.
+
+    Args:
+        liquid_maturities (list): Liquid maturities, shared by all curves.
+        RatesIn (np.array): Zero rates with shape (curves, len(liquid_maturities)).
+            Rates that are NaN are not liquid for that curve.
+        cra (np.array): Credit Risk Adjustment in basispoints, scalar or per curve.
+            Default is 0.
+        ufr (np.array): Ultimate Forward Rate annual compounded (perunage),
+            scalar or per curve. Default is 0.
+        llp (np.array): Last Liquid Point, scalar or per curve. Liquid maturities
+            after the llp are not liquid for that curve. Default is None.
+        min_alfa (float): Minimum value for alfa. Default is 0.05.
+        tau (np.array): Tau value, scalar or per curve. Default is 1.
+        T2 (np.array): Convergence Maturity, scalar or per curve. Default is 60.
+        precision (int): Precision value. Default is 6.
+        tol (float): Absolute tolerance of the bisection. Default is None,
+            which means one tenth of the last decimal of precision.
+        output_type (str): Type of output as in smith_wilson.
+            Default is "zero rates annual compounding".
+        max_maturity (float): Maximum output maturity. Default is 120.
+        step (float): Step between the output maturities, for example 1 / 12
+            for monthly maturities. Default is 1.
+        maturities (np.array): Explicit output maturities, in increasing
+            order starting at 0, instead of max_maturity and step.
+            Default is None.
+
+    Returns:
+        np.array: Output with shape (curves, len(maturities)), the alfa per curve if
+            output_type is "alfa", or a SmithWilsonOutput of these if
+            output_type is "all".
+
+    Example:
+        >>> liquid_maturities = [1, 2, 3, 5, 10]
+        >>> RatesIn = np.array([[0.01, 0.012, 0.014, 0.017, 0.02],
+        ...                     [0.03, 0.031, 0.032, 0.033, np.nan]])
+        >>> smith_wilson_batch(liquid_maturities, RatesIn, cra=10, ufr=[0.036, 0.042],
+        ...                    T2=[60, 65], output_type="alfa")
+        array([0.092886, 0.070925])
+    """
+    u = np.asarray(liquid_maturities)
+    rates = np.atleast_2d(np.asarray(RatesIn, dtype="float64"))
+    k = rates.shape[0]
+
+    ufr = np.broadcast_to(np.asarray(ufr, dtype="float64"), (k,))
+    log_ufr = np.log(1 + ufr)
+    cra = np.broadcast_to(np.asarray(cra, dtype="float64"), (k,)) / 10000
+    tau = np.broadcast_to(np.asarray(tau, dtype="float64"), (k,)) / 10000
+    t2 = np.broadcast_to(np.asarray(T2, dtype="float64"), (k,))
+
+    liquid = ~np.isnan(rates)
+    if llp is not None:
+        liquid &= u <= np.broadcast_to(np.asarray(llp), (k,))[:, None]
+
+    # Q' matrices according to 146 of specs are diagonal, for each zero i
+    # there is only one pay-off of (1+r(i))^u(i) at time u(i)
+    q = np.where(
+        liquid,
+        np.exp(-log_ufr[:, None] * u) * np.power(1 + rates - cra[:, None], u),
+        0,
+    )
+
+    def gap(alfa):
+        return _big_g_batch(alfa, q, u, liquid, t2, tau)
+
+    # Determine optimal alfa with corresponding gamma for all curves, the
+    # sign change of the gap is bracketed by doubling the width of the
+    # interval and then narrowed down by bisection
+    stepsize = 0.1**precision
+    if tol is None or tol > stepsize / 10:
+        # the alfa is rounded up to the grid, a coarser tolerance only adds
+        # evaluations of the gap on the grid
+        tol = stepsize / 10
+    search = gap(np.full(k, float(min_alfa)))[0] > 0
+    lo = np.full(k, float(min_alfa))
+    width = np.where(search, 0.1, 0)
+    gap_hi = gap(lo + width)[0]
+    while np.any(gap_hi > 0):
+        if np.max(width) > 100:
+            raise ValueError("No sign change of the gap function found for alfa.")
+        up = gap_hi > 0
+        lo = np.where(up, lo + width, lo)
+        width = np.where(up, 2 * width, width)
+        gap_hi = gap(lo + width)[0]
+    hi = lo + width
+    while np.max(hi - lo) > tol:
+        mid = (lo + hi) / 2
+        positive = gap(mid)[0] > 0
+        lo = np.where(positive, mid, lo)
+        hi = np.where(positive, hi, mid)
+
+    # round up to the first alfa on the grid of the scan-procedure for
+    # which the gap is non-positive
+    steps = np.where(search, np.floor((lo - min_alfa) / stepsize) + 1, 0)
+    new_alfa, gamma = gap(min_alfa + steps * stepsize)
+    while np.any(new_alfa > 0):
+        steps = steps + (new_alfa > 0)
+        new_alfa, gamma = gap(min_alfa + steps * stepsize)
+    alfa = np.round(min_alfa + steps * stepsize, 6)
+
+    if output_type == "alfa":
+        return alfa
+
+    curve = SmithWilsonCurve(alfa, gamma, u, ufr)
+    outputs = _sw_outputs(curve, _output_maturities(max_maturity, step, maturities))
+    if output_type == "all":
+        return SmithWilsonOutput(*outputs.values(), alfa)
+    return outputs[output_type]
+
+
+def _sw_jacobians(curve: SmithWilsonCurve, dgamma: np.array, v: np.array) -> dict:
+    """
+    Calculates the derivatives of the Smith-Wilson output curves on the
+    maturity grid v to the input rates, given the derivative of gamma.
+
+    Args:
+        curve (SmithWilsonCurve): Calibrated curve.
+        dgamma (np.array): Derivative of gamma with shape (len(u), n).
+        v (np.array): Output maturities, in increasing order starting at 0.
+
+    Returns:
+        dict: The jacobians with shape (len(v), n), keyed by output_type.
+    """
+    v = np.asarray(v, dtype="float64")
+    temp_discount, temp_intensity = curve._kernels(v)
+    # the kernels are linear in gamma, so H(v,u)*dgamma and G(v,u)*dgamma
+    # follow from a curve with dgamma as a batch of gamma vectors
+    d_curve = SmithWilsonCurve(curve.alfa, dgamma.T, curve.maturities, curve.ufr)
+    d_temp_discount, d_temp_intensity = (x.T for x in d_curve._kernels(v))
+    temp_discount = temp_discount[:, None]
+    temp_intensity = temp_intensity[:, None]
+    v = v[:, None]
+
+    discount = np.exp(-curve.log_ufr * v) * (1 + temp_discount)
+    d_discount = np.exp(-curve.log_ufr * v) * d_temp_discount
+
+    d_fwintensity = (
+        -d_temp_intensity / (1 + temp_discount)
+        + temp_intensity * d_temp_discount / (1 + temp_discount) ** 2
+    )
+    d_yldintensity = np.empty_like(d_fwintensity)
+    d_yldintensity[0] = d_fwintensity[0]
+    d_yldintensity[1:] = -d_temp_discount[1:] / ((1 + temp_discount[1:]) * v[1:])
+
+    d_forwardac = np.zeros_like(d_discount)
+    ratio = discount[:-1] / discount[1:]
+    period = np.diff(v, axis=0)
+    d_forwardac[1:] = (
+        np.power(ratio, 1 / period - 1)
+        / period
+        * (d_discount[:-1] - ratio * d_discount[1:])
+        / discount[1:]
+    )
+
+    d_zeroac = np.zeros_like(d_discount)
+    d_zeroac[1:] = -np.power(discount[1:], -1 / v[1:] - 1) / v[1:] * d_discount[1:]
+
+    return {
+        "zero rates annual compounding": d_zeroac,
+        "forward rate annual compounding": d_forwardac,
+        "discount rates": d_discount,
+        "forward intensities": d_fwintensity,
+        "yield intensities": d_yldintensity,
+    }
+
+
+def smith_wilson_jacobian(
+    instrument: str = "Zero",
+    liquid_maturities: list = [],
+    RatesIn: dict = {},
+    nrofcoup: int = 1,
+    cra: float = 0,
+    ufr: float = 0,
+    min_alfa: float = 0.05,
+    tau: float = 1,
+    T2: int = 60,
+    precision: int = 6,
+    method: str = "brute_force",
+    output_type: str = "zero rates annual compounding",
+    tol: float = None,
+    include_alfa: bool = False,
+    max_maturity: float = 120,
+    step: float = 1,
+    maturities: np.array = None,
+):
+    """
+    Calculates the jacobian of the Smith-Wilson output to the input rates.
+
+    The curve is calibrated once, after which the derivatives at the
+    calibrated alfa follow analytically from the linear system of 156 of the
+    specs. With include_alfa the dependence of alfa on the input rates is
+    added by the implicit function theorem on the convergence criterion,
+    with the derivatives to alfa by central differences. Note that this
+    uses the continuous dependence of alfa and not the rounding of alfa to
+    precision decimals. If alfa stays at min_alfa, because the gap is
+    non-positive there, the derivative of alfa is zero.
+
+    Args:
+        instrument (str): Type of financial instrument. Default is "Zero".
+        liquid_maturities (list): Liquid maturities.
+        RatesIn (dict): Input dictionary for RatesIn.
+        nrofcoup (int): Number of Coupon Payments per Year. Default is 1.
+        cra (float): Credit Risk Adjustment in basispoints. Default is 0.
+        ufr (float): Ultimate Forward Rate annual compounded (perunage). Default is 0.
+        min_alfa (float): Minimum value for alfa. Default is 0.05.
+        tau (float): Tau value. Default is 1.
+        T2 (int): Convergence Maturity. Default is 60.
+        precision (int): Precision value. Default is 6.
+        method (str): Calculation method for alfa, "brute_force", "brentq"
+            or "bisection". Default is "brute_force".
+        output_type (str): Type of output as in smith_wilson.
+            Default is "zero rates annual compounding".
+        tol (float): Absolute tolerance for the methods "brentq" and
+            "bisection". Default is None.
+        include_alfa (bool): Include the dependence of alfa on the input
+            rates. Default is False.
+        max_maturity (float): Maximum output maturity. Default is 120.
+        step (float): Step between the output maturities, for example 1 / 12
+            for monthly maturities. Default is 1.
+        maturities (np.array): Explicit output maturities, in increasing
+            order starting at 0, instead of max_maturity and step.
+            Default is None.
+
+    Returns:
+        np.array: Jacobian with shape (len(maturities), len(liquid_maturities)), the
+            derivative of alfa to the input rates if output_type is "alfa",
+            or a SmithWilsonOutput of these if output_type is "all".
+
+    Example:
+        >>> liquid_maturities = [1, 2, 3, 5, 10]
+        >>> RatesIn = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        >>> jacobian = smith_wilson_jacobian("Zero", liquid_maturities, RatesIn, ufr=0.036)
+        >>> np.round(jacobian[60], 6)
+        array([ 0.006641, -0.054198,  0.16533 , -0.358241,  0.548831])
+    """
+    curve = SmithWilsonCurve.calibrate(
+        instrument,
+        liquid_maturities,
+        RatesIn,
+        nrofcoup,
+        cra,
+        ufr,
+        min_alfa,
+        tau,
+        T2,
+        precision,
+        method,
+        tol,
+    )
+    alfa = curve.alfa
+
+    n = len(liquid_maturities)
+    m = nrofcoup * max(liquid_maturities)
+    log_ufr = np.log(1 + ufr)
+    args = (instrument, n, m, liquid_maturities, RatesIn, nrofcoup, cra / 10000)
+    q_full = q_matrix(*args, log_ufr)
+    payoffs = np.flatnonzero(np.any(q_full != 0, axis=0))
+    u = (payoffs + 1) / nrofcoup
+    q = q_full[:, payoffs]
+    dq = _q_matrix_derivative(*args, log_ufr)[:, payoffs]
+
+    # b = ((Q'HQ)^(-1))(1-Q'1) according to 156 of the specs; differentiating
+    # (Q'HQ)b = 1-Q'1 to the rate of instrument k, of which only row k of Q
+    # depends on, gives the derivatives db and dgamma = dQ'b + Q'db
+    h = big_h(alfa * u[:, None], alfa * u)
+    qhq = np.matmul(np.matmul(q, h), q.T)
+    b = np.linalg.solve(qhq, 1 - np.sum(q, axis=1))
+    gamma = np.matmul(q.T, b)
+    rhs = np.diag(-np.sum(dq, axis=1) - np.matmul(np.matmul(dq, h), gamma))
+    rhs -= np.matmul(np.matmul(q, h), dq.T) * b
+    dgamma = dq.T * b + np.matmul(q.T, np.linalg.solve(qhq, rhs))
+
+    v = _output_maturities(max_maturity, step, maturities)
+    jacobians = _sw_jacobians(SmithWilsonCurve(alfa, gamma, u, ufr), dgamma, v)
+    dalfa = np.zeros(n)
+
+    # alfa stays at min_alfa if the gap is non-positive there, so it does
+    # not depend on the input rates
+    at_min_alfa = alfa <= min_alfa and (
+        big_g(alfa, q_full, nrofcoup, T2, tau / 10000)[0] <= 0
+    )
+
+    if include_alfa and not at_min_alfa:
+        # derivative of the gap of 156 of the specs to the input rates
+        res_3 = np.sum(gamma * np.sinh(alfa * u))
+        kappa = (1 + alfa * np.sum(gamma * u)) / res_3
+        res_4 = 1 - kappa * np.exp(T2 * alfa)
+        dkappa = np.matmul(alfa * u - kappa * np.sinh(alfa * u), dgamma) / res_3
+        dgap = alfa * np.sign(res_4) * np.exp(T2 * alfa) * dkappa / res_4**2
+
+        # derivatives of the gap and the outputs to alfa by central differences
+        eps = 1e-6
+        alfas = np.array([alfa - eps, alfa + eps])
+        gaps, gammas = big_g(alfas, q_full, nrofcoup, T2, tau / 10000)
+        dalfa = -dgap / ((gaps[1] - gaps[0]) / (2 * eps))
+        outputs = _sw_outputs(SmithWilsonCurve(alfas, gammas[:, payoffs, 0], u, ufr), v)
+        for key, output in outputs.items():
+            jacobians[key] += np.outer((output[1] - output[0]) / (2 * eps), dalfa)
+
+    if output_type == "alfa":
+        return dalfa
+    elif output_type == "all":
+        return SmithWilsonOutput(*jacobians.values(), dalfa)
+    return jacobians[output_type]
@@ -4,6 +4,18 @@ Common utilities shared across modules
 
 import os
 import configparser
+import hashlib
+import importlib
+import json
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
 
 def get_config():
@@ -58,3 +70,306 @@ def set_config(new_value: str, existing_key: str = "data_folder"):
         config.write(configfile)
     print("Download paths updated")
     return 0
+
+
+def hash_key(*args) -> str:
+    """
+    Hashes the arguments to a key for an LRUCache.
+
+    Dicts are hashed on their sorted items and numpy arrays on their
+    contents, so equal inputs give equal keys.
+
+    Args:
+        *args: The (picklable) arguments to hash.
+
+    Returns:
+        str: The sha256 hex digest of the arguments.
+
+    Example:
+        >>> hash_key([1, 2], {2: 0.01, 1: 0.02}) == hash_key([1, 2], {1: 0.02, 2: 0.01})
+        True
+    """
+
+    def normalize(x):
+        if isinstance(x, dict):
+            return ("dict", tuple(sorted((k, normalize(v)) for k, v in x.items())))
+        if isinstance(x, (list, tuple)):
+            return tuple(normalize(v) for v in x)
+        if hasattr(x, "tolist"):
+            return normalize(x.tolist())
+        return x
+
+    return hashlib.sha256(pickle.dumps(normalize(args))).hexdigest()
+
+
+def _encode_index(index: pd.Index) -> dict:
+    """Labels, dtype and name of an index, to be written as JSON"""
+    if isinstance(index, pd.RangeIndex):
+        return {"range": [index.start, index.stop, index.step], "name": index.name}
+    return {"values": index.tolist(), "dtype": str(index.dtype), "name": index.name}
+
+
+def _decode_index(desc: dict) -> pd.Index:
+    """Index from the output of _encode_index"""
+    if "range" in desc:
+        return pd.RangeIndex(*desc["range"], name=desc["name"])
+    return pd.Index(desc["values"], dtype=desc["dtype"], name=desc["name"])
+
+
+def _encode_frame(df: pd.DataFrame, arrays: dict) -> dict:
+    """
+    Encodes a DataFrame for an npz file: values that are all numbers are
+    added to arrays, everything else is returned to be written as JSON.
+    """
+    desc = {
+        "index": _encode_index(df.index),
+        "columns": _encode_index(df.columns),
+        "dtypes": [str(dtype) for dtype in df.dtypes],
+    }
+    numeric = all(dtype.kind in "biuf" for dtype in df.dtypes)
+    if numeric or all(isinstance(x, float) for x in df.values.flat):
+        values = np.empty(df.shape, dtype="float64")
+        for i in range(df.shape[1]):
+            values[:, i] = df.iloc[:, i].to_numpy(dtype="float64")
+        desc["array"] = "a%d" % len(arrays)
+        arrays[desc["array"]] = values
+    else:
+        desc["values"] = df.values.tolist()
+    return desc
+
+
+def _decode_frame(desc: dict, arrays) -> pd.DataFrame:
+    """DataFrame from the output of _encode_frame"""
+    if "array" in desc:
+        values = arrays[desc["array"]]
+    else:
+        values = np.empty((len(desc["values"]), len(desc["dtypes"])), dtype=object)
+        values[:] = desc["values"]
+    df = pd.DataFrame(
+        {i: values[:, i].astype(dtype) for i, dtype in enumerate(desc["dtypes"])},
+        index=_decode_index(desc["index"]),
+    )
+    df.columns = _decode_index(desc["columns"])
+    return df
+
+
+def _encode_value(value, arrays: dict) -> dict:
+    """
+    Encodes a value for an npz file: numpy arrays and scalars and DataFrames
+    are added to arrays, everything else is returned to be written as JSON.
+    Objects of classes of this package are encoded by their attributes.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        if not isinstance(value, np.generic):
+            return {"value": value}
+    if isinstance(value, (np.ndarray, np.generic)):
+        if value.dtype.kind not in "biufc":
+            raise TypeError("Only numeric numpy arrays can be saved.")
+        name = "a%d" % len(arrays)
+        arrays[name] = value
+        return {"array": name, "scalar": isinstance(value, np.generic)}
+    if isinstance(value, pd.DataFrame):
+        return {"frame": _encode_frame(value, arrays)}
+    if isinstance(value, (list, tuple)):
+        kind = "list" if isinstance(value, list) else "tuple"
+        return {kind: [_encode_value(x, arrays) for x in value]}
+    if isinstance(value, dict):
+        return {
+            "dict": [
+                [_encode_value(k, arrays), _encode_value(v, arrays)]
+                for k, v in value.items()
+            ]
+        }
+    cls = type(value)
+    if cls.__module__.split(".")[0] == __name__.split(".")[0]:
+        return {
+            "object": [cls.__module__, cls.__qualname__],
+            "attributes": _encode_value(vars(value), arrays),
+        }
+    raise TypeError("Values of type %s cannot be saved." % cls.__name__)
+
+
+def _decode_value(desc: dict, arrays):
+    """Value from the output of _encode_value"""
+    if "value" in desc:
+        return desc["value"]
+    if "array" in desc:
+        value = arrays[desc["array"]]
+        return value[()] if desc["scalar"] else value
+    if "frame" in desc:
+        return _decode_frame(desc["frame"], arrays)
+    if "list" in desc:
+        return [_decode_value(x, arrays) for x in desc["list"]]
+    if "tuple" in desc:
+        return tuple(_decode_value(x, arrays) for x in desc["tuple"])
+    if "dict" in desc:
+        return {
+            _decode_value(k, arrays): _decode_value(v, arrays) for k, v in desc["dict"]
+        }
+    module, qualname = desc["object"]
+    if module.split(".")[0] != __name__.split(".")[0]:
+        raise ValueError("Only classes of this package can be loaded.")
+    cls = importlib.import_module(module)
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+    value = cls.__new__(cls)
+    vars(value).update(_decode_value(desc["attributes"], arrays))
+    return value
+
+
+class LRUCache(object):
+    """
+    Thread-safe cache with a bounded size and least recently used eviction.
+
+    Attributes:
+        maxsize (int): Maximum number of entries, None for no bound.
+        path (str): Path of the npz file to persist the cache to.
+        hits (int): Number of lookups that found an entry.
+        misses (int): Number of lookups that did not find an entry.
+
+    Methods:
+        __init__(maxsize, path): Initialize the cache, loading it from path if it exists.
+        get(key, default): Look up an entry and count the hit or miss.
+        put(key, value): Store an entry, evicting the least recently used one.
+        invalidate(key): Remove an entry, or all entries if key is None.
+        cache_info(): Hits, misses, maxsize and current size of the cache.
+        save(): Persist the entries to path.
+    """
+
+    def __init__(self, maxsize: int = 128, path: str = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries, None for no bound. Default is 128.
+            path (str): Path of the npz file to persist the cache to. Default is None.
+
+        Returns:
+            None
+        """
+        assert maxsize is None or maxsize > 0, "maxsize should be positive or None."
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        if path is not None and os.path.isfile(path):
+            with np.load(path, allow_pickle=False) as arrays:
+                entries = json.loads(str(arrays["entries"]))
+                for key, value in entries:
+                    self.put(_decode_value(key, arrays), _decode_value(value, arrays))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Look up an entry, marking it as most recently used.
+
+        Args:
+            key: Key of the entry.
+            default: Value to return if there is no entry. Default is None.
+
+        Returns:
+            The value of the entry or default.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store an entry, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: Key of the entry.
+            value: Value of the entry.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """
+        Remove an entry, or all entries and the counters if key is None.
+
+        Args:
+            key: Key of the entry to remove. Default is None.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if key is None:
+                self._data.clear()
+                self.hits = 0
+                self.misses = 0
+            else:
+                self._data.pop(key, None)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Statistics of the cache.
+
+        Returns:
+            CacheInfo: Hits, misses, maxsize and current size of the cache.
+
+        Example:
+            >>> cache = LRUCache(2)
+            >>> cache.put("a", 1)
+            >>> cache.get("a"), cache.get("b")
+            (1, None)
+            >>> cache.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def save(self):
+        """
+        Persist the entries to path, replacing the file atomically.
+
+        The entries are written to an npz file with numpy arrays as arrays and
+        everything else as JSON, so loading it does not unpickle anything.
+        Keys and values can be numbers, strings, numpy arrays, DataFrames,
+        lists, tuples and dicts of these, and objects of this package such as
+        SmithWilsonCurve.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If path is not set.
+            TypeError: If an entry cannot be saved.
+        """
+        if self.path is None:
+            raise ValueError("path should be set to save the cache.")
+        with self._lock:
+            arrays = {}
+            entries = [
+                [_encode_value(key, arrays), _encode_value(value, arrays)]
+                for key, value in self._data.items()
+            ]
+        arrays["entries"] = np.array(json.dumps(entries))
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.remove(tmp)
+            raise
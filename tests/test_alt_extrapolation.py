@@ -3,7 +3,9 @@
 
 """Tests for alternative extrapolation"""
 
+import inspect
 import solvency2_data
+import numpy as np
 import pandas as pd
 import unittest
 from datetime import datetime
@@ -12,32 +14,44 @@ import pathlib
 
 class TestAltExtra(unittest.TestCase):
     def test_1(self):
-        assert solvency2_data.DiscountedValue4par2forwards(1, 2, 3, 4, 5) == (
-            3.50016,
-            -0.37503999999999993,
+        np.testing.assert_allclose(
+            solvency2_data.DiscountedValue4par2forwards(1, 2, 3, 4, 5),
+            (3.50016, -0.37503999999999993),
+            rtol=1e-14,
         )
 
     def test_2(self):
-        assert solvency2_data.DiscountedValue4par2forwards(10, 20, 30, 40, 50) == (
-            314.0,
-            -0.375,
+        np.testing.assert_allclose(
+            solvency2_data.DiscountedValue4par2forwards(10, 20, 30, 40, 50),
+            (314.0, -0.375),
+            rtol=1e-14,
         )
 
     def test_3(self):
-        assert solvency2_data.DiscountedValue4par2forwards(1, 0.01, 0.02, 0.03, 5) == (
-            -0.9704579707187194,
-            -0.04448945219269113,
+        np.testing.assert_allclose(
+            solvency2_data.DiscountedValue4par2forwards(1, 0.01, 0.02, 0.03, 5),
+            (-0.9704579707187194, -0.04448945219269113),
+            rtol=1e-14,
         )
 
     def test_4(self):
-        assert solvency2_data.DiscountedValue4par2forwards(
-            19.408164389475854, 0.9130243814567768, 0.00422, 0, 5
-        ) == (0.014191649629102854, -4.622916350630098)
+        np.testing.assert_allclose(
+            solvency2_data.DiscountedValue4par2forwards(
+                19.408164389475854, 0.9130243814567768, 0.00422, 0, 5
+            ),
+            (0.014191649629102854, -4.622916350630098),
+            rtol=1e-14,
+        )
 
     def test_5(self):
-        assert solvency2_data.DiscountedValue4par2forwards(
-            19.408164389475854, 0.9130243814567768, 0.00422, 0.003098358839788617, 5
-        ) == (1.1003249270058468e-08, -4.538134856300949)
+        np.testing.assert_allclose(
+            solvency2_data.DiscountedValue4par2forwards(
+                19.408164389475854, 0.9130243814567768, 0.00422, 0.003098358839788617, 5
+            ),
+            (1.1003249270058468e-08, -4.538134856300949),
+            rtol=1e-14,
+            atol=1e-15,
+        )
 
     def test_6(self):
         folder = pathlib.Path(__file__).parent.joinpath("test_data").as_posix()
@@ -379,3 +393,248 @@ class TestAltExtra(unittest.TestCase):
             dtype="float64",
         )
         pd.testing.assert_series_equal(actual_term, expected_term)
+
+    def test_9(self):
+        forward_rate = np.array([-0.01, 0, 1e-9, 0.003098358839788617, 0.05])
+        t_min_k = np.array([1, 5, 10, 5, 30])
+        actual = solvency2_data.DiscountedValue4par2forwards(
+            19.408164389475854, 0.9130243814567768, 0.00422, forward_rate, t_min_k
+        )
+        for i in range(len(forward_rate)):
+            f, n = forward_rate[i], t_min_k[i]
+            expected_1 = 19.408164389475854 * 0.00422 - 1
+            expected_2 = 0
+            for j in range(1, n + 1):
+                expected_1 += 0.00422 * 0.9130243814567768 / (1 + f) ** j
+                expected_2 -= j * 0.00422 * 0.9130243814567768 / (1 + f) ** (j + 1)
+            expected_1 += 0.9130243814567768 / (1 + f) ** n
+            expected_2 -= n * 0.9130243814567768 / (1 + f) ** (n + 1)
+            np.testing.assert_allclose(
+                (actual[0][i], actual[1][i]),
+                (expected_1, expected_2),
+                rtol=1e-11,
+                atol=1e-15,
+            )
+
+    def test_10(self):
+        par = pd.DataFrame(
+            [
+                [-0.00585, -0.00394624, -0.00245477, 0.00202904, 0.00422, 0.00340],
+                [0.01, 0.012, np.nan, 0.02, np.nan, 0.025],
+                [0.03, np.nan, 0.031, 0.032, 0.033, np.nan],
+            ],
+            index=["EUR", "USD", "GBP"],
+            columns=[1, 2, 3, 10, 25, 50],
+        )
+        actual_forwards = solvency2_data.FromParToForwardsBatch(par)
+        for currency in par.index:
+            term_struct = par.loc[currency].dropna()
+            expected_forwards = solvency2_data.FromParToForwards(term_struct)
+            np.testing.assert_allclose(
+                actual_forwards.loc[currency].values,
+                expected_forwards.values,
+                rtol=1e-12,
+                atol=1e-15,
+            )
+        np.testing.assert_allclose(
+            solvency2_data.FromParToForwardsBatch(par.values, par.columns),
+            actual_forwards.values,
+        )
+
+    def test_11(self):
+        forwards = pd.Series(
+            data=[-0.00585, -0.00204637, 0.00053, 0.0015, 0.00166, 0.0026, 0.0036],
+            index=range(1, 8),
+            dtype="float64",
+        )
+        expected_term = pd.Series(index=forwards.index, dtype="float64")
+        previous_forward = 1
+        for i in forwards.index:
+            previous_forward *= 1 + forwards[i]
+            expected_term[i] = previous_forward ** (1 / i) - 1
+        actual_term = solvency2_data.forwardstruct2termstruct(forwards)
+        pd.testing.assert_series_equal(actual_term, expected_term)
+        pd.testing.assert_series_equal(
+            solvency2_data.termstruct2forwardstruct(actual_term), forwards
+        )
+        batch = np.vstack([forwards.values, 2 * forwards.values])
+        np.testing.assert_allclose(
+            solvency2_data.forwardstruct2termstruct(batch)[0], actual_term.values
+        )
+        np.testing.assert_allclose(
+            solvency2_data.discounts2forwards(
+                solvency2_data.zeros2discounts(
+                    solvency2_data.discounts2zeros(
+                        solvency2_data.forwards2discounts(batch)
+                    )
+                )
+            ),
+            batch,
+            rtol=1e-10,
+        )
+
+    def test_12(self):
+        rfr = pd.DataFrame(
+            {
+                "Euro": [-0.00585 + 0.0005 * i for i in range(30)],
+                "USD": [0.01 + 0.0003 * i for i in range(30)],
+                "GBP": [0.02 - 0.0001 * i for i in range(30)],
+            },
+            index=range(1, 31),
+        )
+        additional_swaps = {25: 0.00522, 30: [0.00476, np.nan, 0.025]}
+        actual_swaps = solvency2_data.create_swap_struct_batch(
+            rfr, additional_swaps, cra=[0.001, 0.001, 0.002]
+        )
+        for i, currency in enumerate(rfr.columns):
+            expected_swap = solvency2_data.create_swap_struct(
+                rfr[currency], {25: 0.00522, 30: additional_swaps[30][i]}
+            )
+            if currency == "GBP":
+                expected_swap.loc[[25, 30]] -= 0.001
+            np.testing.assert_allclose(
+                actual_swaps.loc[currency].values, expected_swap.values, rtol=1e-14
+            )
+        self.assertEqual(list(actual_swaps.columns), list(range(1, 21)) + [25, 30])
+
+    def test_13(self):
+        rfr = pd.DataFrame(
+            {
+                "Euro": [-0.00585 + 0.0005 * i for i in range(150)],
+                "Sweden": [0.01 + 0.0003 * i for i in range(150)],
+                "UK": [0.02 - 0.0001 * i for i in range(150)],
+            },
+            index=pd.Index(range(1, 151), name="Duration"),
+        )
+        meta = pd.DataFrame(
+            {"Euro": [20, 10], "Sweden": [20, 10], "UK": [30, 10]},
+            index=["LLP", "CRA"],
+        )
+        additional_swaps = {
+            25: 0.00522,
+            30: pd.Series({"Euro": 0.00476, "Sweden": 0.015}),
+            40: 0.004,
+        }
+        actual_term = solvency2_data.alternative_term_structures(
+            rfr, meta, additional_swaps
+        )
+        for currency in ["Euro", "Sweden"]:
+            actual_swap = solvency2_data.create_swap_struct(
+                rfr=rfr[currency],
+                additional_swaps={
+                    25: 0.00522,
+                    30: additional_swaps[30][currency],
+                    40: 0.004,
+                },
+            )
+            actual_forwards = solvency2_data.FromParToForwards(actual_swap)
+            expected_term = solvency2_data.forwardstruct2termstruct(actual_forwards)
+            np.testing.assert_allclose(
+                actual_term[currency].values, expected_term.values, rtol=1e-12
+            )
+        uk_swap = solvency2_data.create_swap_struct_batch(
+            rfr[["UK"]], max_duration=30
+        ).loc["UK"]
+        uk_swap[25] = 0.00522 - 0.001
+        uk_swap[40] = 0.004 - 0.001
+        expected_uk = solvency2_data.forwardstruct2termstruct(
+            solvency2_data.FromParToForwards(uk_swap)
+        )
+        np.testing.assert_allclose(actual_term["UK"].values, expected_uk.values)
+
+        data = {"2021-11-30": {"RFR_spot_no_VA": rfr, "meta": meta}}
+        data["2021-12-31"] = {"RFR_spot_no_VA": rfr + 0.001, "meta": meta}
+        actual_dates = solvency2_data.alternative_term_structures_dates(
+            data, {"2021-11-30": additional_swaps}, max_workers=2
+        )
+        pd.testing.assert_frame_equal(actual_dates["2021-11-30"], actual_term)
+        pd.testing.assert_frame_equal(
+            actual_dates["2021-12-31"],
+            solvency2_data.alternative_term_structures(rfr + 0.001, meta),
+        )
+
+    def test_14(self):
+        par = pd.DataFrame(
+            [
+                [-0.00585, -0.00394624, -0.00245477, 0.00202904, 0.00422],
+                [0.01, 0.012, np.nan, 0.02, 0.025],
+            ],
+            columns=[1, 2, 3, 10, 25],
+        )
+        forwards, diagnostics = solvency2_data.FromParToForwardsBatch(
+            par, diagnostics=True
+        )
+        for i in par.index:
+            expected_forwards, expected = solvency2_data.FromParToForwards(
+                par.loc[i].dropna(), diagnostics=True
+            )
+            pd.testing.assert_series_equal(
+                diagnostics["iterations"].loc[i].dropna(),
+                expected["iterations"].astype("float64"),
+                check_names=False,
+            )
+            self.assertTrue(expected["converged"].all())
+            self.assertTrue((expected["residual"] < 1e-10).all())
+        self.assertEqual(diagnostics["converged"].sum().sum(), 9)
+        self.assertEqual(len(diagnostics["time"]), 5)
+
+        with self.assertLogs(level="WARNING") as logs:
+            _, diagnostics = solvency2_data.FromParToForwardsBatch(
+                par, max_runs=0, diagnostics=True
+            )
+        self.assertEqual(diagnostics["iterations"].max().max(), 1)
+        self.assertFalse(diagnostics["converged"].loc[1, 25])
+        self.assertIn("No convergence for maturity", logs.output[0])
+        with self.assertLogs(level="WARNING"):
+            _, expected = solvency2_data.FromParToForwards(
+                par.loc[1].dropna(), max_runs=0, diagnostics=True
+            )
+        self.assertFalse(expected["converged"].all())
+
+    def test_16(self):
+        # currencies without spot rates or LLP give NaN term structures
+        rfr = pd.DataFrame(
+            {
+                "Euro": [-0.00585 + 0.0005 * i for i in range(150)],
+                "Bulgaria": [np.nan] * 150,
+                "Sweden": [0.01 + 0.0003 * i for i in range(150)],
+                "Romania": [0.02 + 0.0001 * i for i in range(150)],
+            },
+            index=pd.Index(range(1, 151), name="Duration"),
+        )
+        meta = pd.DataFrame(
+            {
+                "Euro": [20, 10],
+                "Bulgaria": [20, 10],
+                "Sweden": [20, 10],
+                "Romania": [None, 10],
+            },
+            index=["LLP", "CRA"],
+            dtype=object,
+        )
+        additional_swaps = {25: 0.00522, 30: pd.Series({"Sweden": 0.015})}
+        with self.assertLogs(level="WARNING") as logs:
+            actual = solvency2_data.alternative_term_structures(
+                rfr, meta, additional_swaps
+            )
+        expected = solvency2_data.alternative_term_structures(
+            rfr[["Euro", "Sweden"]], meta, additional_swaps
+        )
+        self.assertIn("['Bulgaria', 'Romania']", logs.output[0])
+        self.assertEqual(list(actual.columns), list(rfr.columns))
+        self.assertTrue(actual[["Bulgaria", "Romania"]].isna().all().all())
+        pd.testing.assert_frame_equal(actual[["Euro", "Sweden"]], expected)
+
+        with self.assertLogs(level="WARNING"):
+            actual_dates = solvency2_data.alternative_term_structures_dates(
+                {"2021-12-31": {"RFR_spot_no_VA": rfr, "meta": meta}}
+            )
+        self.assertTrue(actual_dates["2021-12-31"]["Bulgaria"].isna().all())
+
+    def test_15(self):
+        # the module is not shadowed by a function of the same name
+        import solvency2_data.alternative_extrapolation as ae
+
+        self.assertTrue(inspect.ismodule(ae))
+        self.assertIs(ae.FromParToForwards, solvency2_data.FromParToForwards)
+        self.assertTrue(inspect.ismodule(solvency2_data.alternative_extrapolation))
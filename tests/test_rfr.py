@@ -3,18 +3,113 @@
 
 """Tests for `solvency2_data` package."""
 
+import os
 import pathlib
+import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
+import zipfile
 import numpy as np
+import openpyxl
 import pandas as pd
 
 from datetime import datetime
+from io import BytesIO
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 import solvency2_data
 from solvency2_data import rfr
 from solvency2_data.eiopa_data import get
 
 
+def write_term_structures(path: str):
+    """Writes a small Term_Structures file with the layout of EIOPA"""
+    rng = np.random.default_rng(0)
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    meta = [
+        [None, "EUR", "ATS", "USD"],
+        ["Coupon_freq", 1, 1, 2],
+        ["LLP", 20, 20, 50],
+        ["Convergence", 40, 40, 40],
+        ["UFR", 3.6, 3.6, 3.6],
+        ["alpha", 0.126, 0.126, 0.13],
+        ["CRA", 10, 10, 10],
+        ["VA", None, 3, 1.5],
+    ]
+    for name in ["RFR_spot_no_VA", "RFR_spot_with_VA", "Spot_NO_VA_shock_UP"]:
+        ws = wb.create_sheet(name)
+        ws.append(["Main menu"])
+        ws.append([None, None, "Euro", None, "Austria", "United States"])
+        for row in meta:
+            ws.append([None, row[0], row[1], None, row[2], row[3]])
+        for duration in range(1, 151):
+            rates = rng.random(3) / 100
+            ws.append([None, duration, rates[0], None, rates[1], rates[2]])
+        ws.append(["Footnote"])
+    wb.save(path)
+
+
+def write_pd_cod(path: str):
+    """Writes a small PD_Cod file with the layout of EIOPA"""
+    rng = np.random.default_rng(1)
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for name in ["EUR", "USD"]:
+        ws = wb.create_sheet(name)
+        for skiprows in [8, 48]:
+            ws.cell(skiprows + 2, 23, "Duration")
+            for step in range(1, 7):
+                ws.cell(skiprows + 2, 23 + step, "CQS " + str(step - 1))
+            for duration in range(1, 31):
+                ws.cell(skiprows + 2 + duration, 23, duration)
+                for step in range(1, 7):
+                    ws.cell(skiprows + 2 + duration, 23 + step, rng.random())
+        ws.cell(100, 1, "Footnote")
+    ws = wb.create_sheet("FS_Govts")
+    ws.cell(10, 2, "Country")
+    for col in range(3, 33):
+        ws.cell(10, col, "Duration " + str(col - 2))
+    for row in range(11, 64):
+        ws.cell(row, 2, "Country " + str(row - 10))
+        for col in range(3, 33):
+            ws.cell(row, col, rng.random())
+    wb.save(path)
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Serves payload with Range support, dropping the first connection halfway"""
+
+    payload = bytes(range(256)) * 4096
+    requests = []
+
+    def do_GET(self):
+        FlakyHandler.requests.append(self.headers.get("Range"))
+        start = 0
+        if self.headers.get("Range") is not None:
+            start = int(self.headers["Range"][6:-1])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                "bytes %d-%d/%d" % (start, len(self.payload) - 1, len(self.payload)),
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(self.payload) - start))
+        self.end_headers()
+        if len(FlakyHandler.requests) == 1:
+            self.wfile.write(self.payload[: len(self.payload) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+        else:
+            self.wfile.write(self.payload[start:])
+
+    def log_message(self, *args):
+        pass
+
+
 class TestReadRFR(unittest.TestCase):
     def test_read_input_date(self):
         """Test of read input date function"""
@@ -444,6 +539,408 @@ class TestReadRFR(unittest.TestCase):
             actual == expected
         ).all(), "Read function, spot rates: returned values not matching"
 
+    def test_read_term_structures(self):
+        """Test of the single-pass reader of the Term_Structures file"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            path = os.path.join(folder, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            write_term_structures(path)
+
+            # Expected output
+            xls = pd.ExcelFile(path, engine="openpyxl")
+            expected = rfr.read_meta(xls, {})
+            expected = rfr.read_spot(xls, expected)
+            xls.close()
+
+            # Actual output
+            actual = rfr.read_term_structures(path, {})
+
+        # Assert
+        self.assertEqual(sorted(actual.keys()), sorted(expected.keys()))
+        for key in expected.keys():
+            pd.testing.assert_frame_equal(actual[key], expected[key])
+        self.assertEqual(actual["meta"].loc["LLP", "United States"], 50)
+        self.assertEqual(list(actual["RFR_spot_no_VA"].index), list(range(1, 151)))
+
+    def test_read_pd_cod(self):
+        """Test of the single-pass reader of the PD_Cod file"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            path = os.path.join(folder, "EIOPA_RFR_20211231_PD_Cod.xlsx")
+            write_pd_cod(path)
+
+            # Expected output
+            xls = pd.ExcelFile(path, engine="openpyxl")
+            expected = rfr.read_spreads(xls, {})
+            expected = rfr.read_govies(xls, expected)
+            xls.close()
+
+            # Actual output
+            actual = rfr.read_pd_cod(path, {})
+
+        # Assert
+        for key in [
+            "financial fundamental spreads",
+            "non-financial fundamental spreads",
+        ]:
+            self.assertEqual(sorted(actual[key].keys()), ["EUR", "USD"])
+            for name in ["EUR", "USD"]:
+                pd.testing.assert_frame_equal(actual[key][name], expected[key][name])
+        pd.testing.assert_frame_equal(
+            actual["central government fundamental spreads"],
+            expected["central government fundamental spreads"],
+        )
+
+    def test_read_sidecar(self):
+        """Test of the sidecar files with the parsed Excel files"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            path = os.path.join(folder, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            path_spreads = os.path.join(folder, "EIOPA_RFR_20211231_PD_Cod.xlsx")
+            write_term_structures(path)
+            write_pd_cod(path_spreads)
+
+            # Expected output
+            expected = rfr.read(
+                "2021-12-31", path=folder, sidecar=False, use_cache=False
+            )
+
+            # Actual output
+            first = rfr.read("2021-12-31", path=folder, use_cache=False)
+            second = rfr.read("2021-12-31", path=folder, use_cache=False)
+            sidecars = [
+                os.path.isfile(path + ".npz"),
+                os.path.isfile(path_spreads + ".npz"),
+            ]
+            # the sidecar files hold no pickled objects
+            for sidecar in [path + ".npz", path_spreads + ".npz"]:
+                with np.load(sidecar, allow_pickle=False) as arrays:
+                    for name in arrays.files:
+                        self.assertNotEqual(arrays[name].dtype, object)
+            # a sidecar with matching source is used instead of the Excel file
+            source, stored = rfr._load_sidecar(path + ".npz")
+            stored["meta"] = stored["meta"].iloc[:2]
+            rfr._write_sidecar(path + ".npz", source, stored)
+            from_sidecar = rfr.read("2021-12-31", path=folder, use_cache=False)["meta"]
+            # a changed Excel file is parsed again
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            reparsed = rfr.read("2021-12-31", path=folder, use_cache=False)["meta"]
+
+        # Assert
+        self.assertEqual(sidecars, [True, True])
+        for actual in [first, second]:
+            self.assertEqual(sorted(actual.keys()), sorted(expected.keys()))
+            for key in rfr.term_structures_keys + rfr.pd_cod_keys[2:]:
+                if key in expected:
+                    pd.testing.assert_frame_equal(actual[key], expected[key])
+            for key in rfr.pd_cod_keys[:2]:
+                for name in expected[key]:
+                    pd.testing.assert_frame_equal(
+                        actual[key][name], expected[key][name]
+                    )
+        pd.testing.assert_frame_equal(from_sidecar, expected["meta"].iloc[:2])
+        pd.testing.assert_frame_equal(reparsed, expected["meta"])
+
+    def test_read_cache(self):
+        """Test of the cache with the results of read"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            write_term_structures(
+                os.path.join(folder, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            )
+            write_pd_cod(os.path.join(folder, "EIOPA_RFR_20211231_PD_Cod.xlsx"))
+            rfr.invalidate_read_cache()
+
+            # Actual output
+            first = rfr.read("2021-12-31", path=folder, sidecar=False)
+            expected = first["RFR_spot_no_VA"]["Euro"].copy()
+            first["RFR_spot_no_VA"]["Euro"] *= 100
+            first["financial fundamental spreads"]["EUR"] *= 100
+            second = rfr.read("2021-12-31", path=folder, sidecar=False)
+            info = rfr.read_cache.cache_info()
+            uncached = rfr.read(
+                "2021-12-31", path=folder, sidecar=False, use_cache=False
+            )
+            rfr.invalidate_read_cache("2021-12-31", path=folder)
+            size = len(rfr.read_cache)
+            third = rfr.read("2021-12-31", path=folder, sidecar=False)
+            rfr.invalidate_read_cache()
+
+        # Assert
+        self.assertIsNot(second["meta"], first["meta"])
+        pd.testing.assert_series_equal(second["RFR_spot_no_VA"]["Euro"], expected)
+        self.assertIsNot(
+            second["financial fundamental spreads"]["EUR"],
+            first["financial fundamental spreads"]["EUR"],
+        )
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+        self.assertIsNot(uncached["meta"], first["meta"])
+        self.assertEqual(size, 0)
+        self.assertIsNot(third["meta"], first["meta"])
+        pd.testing.assert_frame_equal(third["meta"], first["meta"])
+
+    def test_download_zip(self):
+        """Test of the resumed download after a dropped connection"""
+
+        server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        FlakyHandler.requests = []
+        try:
+            with tempfile.TemporaryDirectory() as folder:
+                # Input
+                url = "http://127.0.0.1:%d/EIOPA_RFR_20211231.zip" % server.server_port
+                target = os.path.join(folder, "EIOPA_RFR_20211231.zip")
+
+                # Expected output
+                expected = FlakyHandler.payload
+
+                # Actual output
+                with self.assertLogs(level="WARNING"):
+                    path = rfr.download_zip(
+                        url, target, proxies={}, timeout=5, chunk_size=4096
+                    )
+                with open(path, "rb") as f:
+                    actual = f.read()
+                files = os.listdir(folder)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        # Assert
+        self.assertEqual(actual, expected)
+        self.assertEqual(files, ["EIOPA_RFR_20211231.zip"])
+        self.assertEqual(
+            FlakyHandler.requests, [None, "bytes=%d-" % (len(expected) // 2)]
+        )
+
+    def test_read_from_zip(self):
+        """Test of reading the Excel files from a zip file or a file-like object"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            path = os.path.join(folder, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            path_spreads = os.path.join(folder, "EIOPA_RFR_20211231_PD_Cod.xlsx")
+            write_term_structures(path)
+            write_pd_cod(path_spreads)
+            path_zip = os.path.join(folder, "EIOPA_RFR_20211231.zip")
+            with zipfile.ZipFile(path_zip, "w") as zip_ref:
+                zip_ref.write(path, "EIOPA_RFR_20211231/" + os.path.basename(path))
+            with open(path_spreads, "rb") as f:
+                spreads = BytesIO(f.read())
+
+            # Expected output
+            expected = rfr.read_term_structures(path)
+            expected = rfr.read_pd_cod(path_spreads, expected)
+
+            # Actual output
+            actual = rfr.read_with_sidecar(
+                path_zip,
+                rfr.read_term_structures,
+                member="EIOPA_RFR_20211231/" + os.path.basename(path),
+            )
+            actual = rfr.read_pd_cod(spreads, actual)
+            sidecar = os.path.isfile(path_zip + "." + os.path.basename(path) + ".npz")
+
+        # Assert
+        self.assertTrue(sidecar)
+        for key in ["meta", "RFR_spot_no_VA", "central government fundamental spreads"]:
+            pd.testing.assert_frame_equal(actual[key], expected[key])
+        pd.testing.assert_frame_equal(
+            actual["financial fundamental spreads"]["EUR"],
+            expected["financial fundamental spreads"]["EUR"],
+        )
+
+    def test_read_without_extract(self):
+        """Test of read from a zip file downloaded earlier, without extracting"""
+
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as folder:
+            # Input
+            path = os.path.join(source, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            path_spreads = os.path.join(source, "EIOPA_RFR_20211231_PD_Cod.xlsx")
+            write_term_structures(path)
+            write_pd_cod(path_spreads)
+            path_zip = os.path.join(folder, "EIOPA_RFR_20211231.zip")
+            with zipfile.ZipFile(path_zip, "w") as zip_ref:
+                zip_ref.write(path, os.path.basename(path))
+                zip_ref.write(path_spreads, os.path.basename(path_spreads))
+            with zipfile.ZipFile(os.path.join(folder, "other.zip"), "w") as zip_ref:
+                zip_ref.writestr("readme.txt", "other release")
+            mtime = os.stat(path_zip).st_mtime_ns
+
+            # Expected output
+            expected = rfr.read_term_structures(path)
+            expected = rfr.read_pd_cod(path_spreads, expected)
+
+            # Actual output
+            with mock.patch.object(
+                rfr, "eiopa_link", side_effect=AssertionError("no download")
+            ), mock.patch.object(
+                rfr, "download_zip", side_effect=AssertionError("no download")
+            ):
+                first = rfr.read(
+                    "2021-12-31", path=folder, extract=False, use_cache=False
+                )
+                second = rfr.read(
+                    "2021-12-31", path=folder, extract=False, use_cache=False
+                )
+            files = sorted(os.listdir(folder))
+            mtime_after = os.stat(path_zip).st_mtime_ns
+
+        # Assert
+        self.assertEqual(os.path.basename(path_zip), first["name_zipfile"])
+        self.assertEqual(
+            files,
+            [
+                "EIOPA_RFR_20211231.zip",
+                "EIOPA_RFR_20211231.zip.EIOPA_RFR_20211231_PD_Cod.xlsx.npz",
+                "EIOPA_RFR_20211231.zip.EIOPA_RFR_20211231_Term_Structures.xlsx.npz",
+                "other.zip",
+            ],
+        )
+        self.assertEqual(mtime_after, mtime)
+        for actual in [first, second]:
+            for key in [
+                "meta",
+                "RFR_spot_no_VA",
+                "central government fundamental spreads",
+            ]:
+                pd.testing.assert_frame_equal(actual[key], expected[key])
+            pd.testing.assert_frame_equal(
+                actual["financial fundamental spreads"]["USD"],
+                expected["financial fundamental spreads"]["USD"],
+            )
+
+    def test_read_lazy(self):
+        """Test of the lazy read of a release"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            write_term_structures(
+                os.path.join(folder, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            )
+            write_pd_cod(os.path.join(folder, "EIOPA_RFR_20211231_PD_Cod.xlsx"))
+            rfr.invalidate_read_cache()
+
+            # Expected output
+            expected = rfr.read("2021-12-31", path=folder, use_cache=False)
+
+            # Actual output
+            actual = rfr.read("2021-12-31", path=folder, lazy=True)
+            actual["RFR_spot_no_VA"]["Euro"] *= 100
+            spot = actual["RFR_spot_no_VA"]
+            read_keys = [key for key in rfr.term_structures_keys if key in actual.data]
+            cached = rfr.read("2021-12-31", path=folder, lazy=True)
+            complete = dict(actual)
+            rfr.invalidate_read_cache()
+
+        # Assert
+        self.assertIsInstance(actual, rfr.LazyRelease)
+        self.assertEqual(read_keys, ["RFR_spot_no_VA"])
+        self.assertIs(cached, actual)
+        self.assertEqual(sorted(complete.keys()), sorted(expected.keys()))
+        pd.testing.assert_frame_equal(spot, expected["RFR_spot_no_VA"])
+        for key in ["meta", "Spot_NO_VA_shock_UP"]:
+            pd.testing.assert_frame_equal(complete[key], expected[key])
+        for key in rfr.pd_cod_keys[:2]:
+            pd.testing.assert_frame_equal(complete[key]["USD"], expected[key]["USD"])
+        pd.testing.assert_frame_equal(
+            complete["central government fundamental spreads"],
+            expected["central government fundamental spreads"],
+        )
+
+    def test_read_lazy_then_eager(self):
+        """Test of an eager read after a lazy read of the same release"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            write_term_structures(
+                os.path.join(folder, "EIOPA_RFR_20211231_Term_Structures.xlsx")
+            )
+            write_pd_cod(os.path.join(folder, "EIOPA_RFR_20211231_PD_Cod.xlsx"))
+            rfr.invalidate_read_cache()
+
+            # Expected output
+            expected = rfr.read("2021-12-31", path=folder, use_cache=False)
+
+            # Actual output
+            lazy = rfr.read("2021-12-31", path=folder, lazy=True)
+            lazy["meta"]
+            with mock.patch.object(
+                rfr, "read_with_sidecar", wraps=rfr.read_with_sidecar
+            ) as read_with_sidecar, mock.patch.object(
+                rfr, "download_RFR", wraps=rfr.download_RFR
+            ) as download_RFR:
+                actual = rfr.read("2021-12-31", path=folder)
+            cached = rfr.read_cache.get(rfr.read_cache_key("2021-12-31", folder))
+            again = rfr.read("2021-12-31", path=folder, lazy=True)
+            rfr.invalidate_read_cache()
+
+        # Assert
+        self.assertIsInstance(actual, dict)
+        self.assertNotIsInstance(cached, rfr.LazyRelease)
+        self.assertNotIsInstance(again, rfr.LazyRelease)
+        self.assertEqual(read_with_sidecar.call_count, 2)
+        self.assertEqual(download_RFR.call_count, 0)
+        self.assertEqual(sorted(actual.keys()), sorted(expected.keys()))
+        for key in ["meta", "RFR_spot_no_VA", "Spot_NO_VA_shock_UP"]:
+            pd.testing.assert_frame_equal(actual[key], expected[key])
+            pd.testing.assert_frame_equal(again[key], expected[key])
+        for key in rfr.pd_cod_keys[:2]:
+            pd.testing.assert_frame_equal(actual[key]["USD"], expected[key]["USD"])
+
+    def test_read_range(self):
+        """Test of the panels of multiple releases read in parallel"""
+
+        with tempfile.TemporaryDirectory() as folder:
+            # Input
+            for date in ["20211130", "20211231"]:
+                write_term_structures(
+                    os.path.join(folder, "EIOPA_RFR_%s_Term_Structures.xlsx" % date)
+                )
+                write_pd_cod(os.path.join(folder, "EIOPA_RFR_%s_PD_Cod.xlsx" % date))
+            dates = ["2021-11-30", datetime(2021, 12, 31), "2022-01-01", "2022-01-04"]
+
+            # Expected output
+            expected = rfr.read("2021-12-31", path=folder, use_cache=False)
+
+            # Actual output
+            actual = rfr.read_range(dates, path=folder, max_workers=2)
+            with mock.patch.object(rfr, "_read_date", wraps=rfr._read_date) as read:
+                rfr.read_range(dates, path=folder)
+
+        # Assert
+        ref_dates = [pd.Timestamp("2021-11-30"), pd.Timestamp("2021-12-31")]
+        self.assertEqual(
+            [call.args[0][0] for call in read.call_args_list],
+            ["2021-11-30", "2021-12-31"],
+        )
+        spot = actual["RFR_spot_no_VA"]
+        self.assertEqual(spot.index.names, ["ref_date", "Duration"])
+        self.assertEqual(spot.index.levels[0].tolist(), ref_dates)
+        pd.testing.assert_frame_equal(
+            spot.loc[ref_dates[1]], expected["RFR_spot_no_VA"]
+        )
+        pd.testing.assert_frame_equal(
+            actual["meta"].loc[ref_dates[1]], expected["meta"]
+        )
+        spreads = actual["financial fundamental spreads"]
+        self.assertEqual(spreads.index.names, ["ref_date", "currency", "duration"])
+        pd.testing.assert_frame_equal(
+            spreads.loc[(ref_dates[1], "USD")],
+            expected["financial fundamental spreads"]["USD"],
+            check_names=False,
+        )
+        self.assertEqual(
+            actual["central government fundamental spreads"].shape, (2 * 30, 53)
+        )
+
 
 class TestEiopaDB(unittest.TestCase):
     def test_db_spot_rates(self):
@@ -849,6 +1346,34 @@ class TestSmithWilson(unittest.TestCase):
             actual, expected, decimal=8, err_msg="big_g output not matching"
         )
 
+    def test_big_g_vectorized(self):
+        """Test of big_g with an array of alfas"""
+
+        # Input
+        alfas = np.array([0.1, 0.5, 1.1])
+        q = np.array([[1, 0, 0, 0], [0, 1.01, 0, 0], [0, 0, 1.02, 0], [0, 0, 0, 1.03]])
+        t2 = 1
+        tau = 0.9
+        nrofcoup = 1
+
+        # Expected output
+        expected = [solvency2_data.big_g(a, q, nrofcoup, t2, tau) for a in alfas]
+
+        # Actual output
+        actual = solvency2_data.big_g(alfas, q, nrofcoup, t2, tau)
+
+        # Assert
+        self.assertTupleEqual(actual[1].shape, (3, 4, 1), "Shapes not matching")
+        np.testing.assert_almost_equal(
+            actual[0], [e[0] for e in expected], decimal=12, err_msg="gaps not matching"
+        )
+        np.testing.assert_almost_equal(
+            actual[1],
+            [e[1] for e in expected],
+            decimal=12,
+            err_msg="gammas not matching",
+        )
+
     def test_smith_wilson(self):
         liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
         rates = {
@@ -1026,6 +1551,602 @@ class TestSmithWilson(unittest.TestCase):
             err_msg="smith_wilson_brute_force output not matching",
         )
 
+    def test_optimal_alfa_root_finders(self):
+        """Test that brentq and bisection reproduce the brute force alfa"""
+
+        # Input
+        liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
+        rates = dict(
+            zip(
+                liqmat,
+                [
+                    0.0211,
+                    0.0236,
+                    0.0252,
+                    0.0263,
+                    0.0271,
+                    0.0278,
+                    0.0284,
+                    0.0289,
+                    0.0293,
+                    0.0297,
+                    0.0303,
+                    0.0309,
+                    0.0312,
+                ],
+            )
+        )
+
+        # Expected output
+        expected = solvency2_data.smith_wilson(
+            "Zero", liqmat, rates, 1, 10, 0.0345, output_type="alfa"
+        )
+
+        for method in ["brentq", "bisection"]:
+            # Actual output
+            actual = solvency2_data.smith_wilson(
+                "Zero", liqmat, rates, 1, 10, 0.0345, method=method, output_type="alfa"
+            )
+
+            # Assert
+            self.assertEqual(actual, expected, method + " alfa not matching")
+
+    def test_optimal_alfa_high_alfa(self):
+        """Test that all methods give the same alfa above the first interval"""
+
+        # Input
+        liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
+        rates = dict(
+            zip(
+                liqmat,
+                [
+                    0.0,
+                    0.04,
+                    0.0,
+                    0.045,
+                    0.0,
+                    0.04,
+                    0.005,
+                    0.05,
+                    0.0,
+                    0.04,
+                    0.0,
+                    0.045,
+                    0.01,
+                ],
+            )
+        )
+
+        # Expected output
+        expected = 0.169074
+
+        # Actual output
+        actual = {
+            method: solvency2_data.smith_wilson(
+                "Zero", liqmat, rates, 1, 10, 0.0345, method=method, output_type="alfa"
+            )
+            for method in ["brute_force", "brentq", "bisection"]
+        }
+        actual["tol"] = solvency2_data.smith_wilson(
+            "Zero",
+            liqmat,
+            rates,
+            1,
+            10,
+            0.0345,
+            method="brentq",
+            tol=1e-2,
+            output_type="alfa",
+        )
+        actual["warm_start"] = solvency2_data.smith_wilson(
+            "Zero", liqmat, rates, 1, 10, 0.0345, output_type="alfa", warm_start=0.2
+        )
+
+        # Assert
+        for name, alfa in actual.items():
+            self.assertAlmostEqual(alfa, expected, 9, name + " alfa not matching")
+
+    def test_smith_wilson_batch(self):
+        """Test that the batch calibration matches smith_wilson per curve"""
+
+        # Input
+        liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
+        rates = np.array(
+            [
+                [-0.00525, -0.00553, -0.00559, -0.00534, -0.00505, -0.00467]
+                + [-0.0042, -0.00366, -0.00309, -0.00254, -0.0015, -0.00024, 0.00092],
+                [0.0211, 0.0236, 0.0252, 0.0263, 0.0271, 0.0278, 0.0284]
+                + [0.0289, 0.0293, 0.0297, 0.0303, 0.0309, np.nan],
+            ]
+        )
+        cra = 10
+        ufr = np.array([0.036, 0.0345])
+        t2 = np.array([60, 55])
+
+        # Expected output
+        expected = np.array(
+            [
+                solvency2_data.smith_wilson(
+                    "Zero", liqmat, dict(zip(liqmat, rates[0])), 1, cra, ufr[0], T2=60
+                ),
+                solvency2_data.smith_wilson(
+                    "Zero",
+                    liqmat[:-1],
+                    dict(zip(liqmat, rates[1])),
+                    1,
+                    cra,
+                    ufr[1],
+                    T2=55,
+                ),
+            ]
+        )
+
+        # Actual output
+        actual = solvency2_data.smith_wilson_batch(liqmat, rates, cra, ufr, T2=t2)
+
+        # Assert
+        self.assertTupleEqual(actual.shape, expected.shape, "Shapes not matching")
+        np.testing.assert_almost_equal(
+            actual, expected, decimal=10, err_msg="smith_wilson_batch not matching"
+        )
+
+    def test_smith_wilson_curve(self):
+        """Test of the calibrated curve at real-valued maturities"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        ufr = 0.036
+
+        # Expected output
+        expected = solvency2_data.smith_wilson(
+            "Zero", liqmat, rates, 1, 0, ufr, output_type="discount rates"
+        )
+
+        # Actual output
+        curve = solvency2_data.SmithWilsonCurve.calibrate(
+            "Zero", liqmat, rates, 1, 0, ufr
+        )
+        actual = curve.discount_rates(np.arange(0, 121))
+        monthly = np.arange(0, 150 * 12 + 1) / 12
+
+        # Assert
+        np.testing.assert_almost_equal(
+            actual, expected, decimal=12, err_msg="discount rates not matching"
+        )
+        np.testing.assert_almost_equal(
+            curve.zero_rates(np.array(liqmat, dtype="float64")),
+            np.array(list(rates.values())),
+            decimal=12,
+            err_msg="zero rates not reproducing input rates",
+        )
+        np.testing.assert_almost_equal(
+            curve.forward_intensities(monthly[1:-1]),
+            -np.log(
+                curve.discount_rates(monthly[2:]) / curve.discount_rates(monthly[:-2])
+            )
+            * 6,
+            decimal=5,
+            err_msg="forward intensities not matching discount rates",
+        )
+
+    def test_smith_wilson_warm_start(self):
+        """Test of warm-started recalibrations on changed rates"""
+
+        # Input
+        liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
+        rates = {m: 0.01 + 0.002 * np.sqrt(m) for m in liqmat}
+        previous = solvency2_data.SmithWilsonCurve.calibrate(
+            "Zero", liqmat, rates, 1, 10, 0.036
+        )
+        for bump in [0, 0.00001, 0.001, 0.01]:
+            bumped = {m: r + bump * np.sin(m) for m, r in rates.items()}
+
+            # Expected output
+            expected = solvency2_data.SmithWilsonCurve.calibrate(
+                "Zero", liqmat, bumped, 1, 10, 0.036, method="brentq"
+            )
+
+            # Actual output
+            actual = solvency2_data.SmithWilsonCurve.calibrate(
+                "Zero", liqmat, bumped, 1, 10, 0.036, warm_start=previous
+            )
+            actual_alfa = solvency2_data.smith_wilson(
+                "Zero",
+                liqmat,
+                bumped,
+                1,
+                10,
+                0.036,
+                output_type="alfa",
+                warm_start=previous.alfa,
+            )
+
+            # Assert
+            self.assertEqual(actual.alfa, expected.alfa, "alfa not matching")
+            self.assertEqual(actual_alfa, expected.alfa, "alfa not matching")
+            np.testing.assert_almost_equal(
+                actual.zero_rates(np.arange(0, 121)),
+                expected.zero_rates(np.arange(0, 121)),
+                decimal=12,
+                err_msg="zero rates not matching",
+            )
+
+    def test_smith_wilson_warm_start_evaluations(self):
+        """Test that a warm start evaluates the gap function less often"""
+
+        # Input
+        liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
+        rates = {m: 0.01 + 0.002 * np.sqrt(m) for m in liqmat}
+        bumped = {m: r + 0.0001 for m, r in rates.items()}
+        previous = solvency2_data.SmithWilsonCurve.calibrate(
+            "Swap", liqmat, rates, 1, 10, 0.0345
+        )
+        module = sys.modules["solvency2_data.smith_wilson"]
+
+        # Expected output
+        with mock.patch.object(module, "big_g", wraps=module.big_g) as big_g:
+            expected = solvency2_data.SmithWilsonCurve.calibrate(
+                "Swap", liqmat, bumped, 1, 10, 0.0345, method="brentq"
+            )
+        cold_calls = big_g.call_count
+
+        # Actual output
+        with mock.patch.object(module, "big_g", wraps=module.big_g) as big_g:
+            actual = solvency2_data.SmithWilsonCurve.calibrate(
+                "Swap", liqmat, bumped, 1, 10, 0.0345, warm_start=previous
+            )
+        warm_calls = big_g.call_count
+
+        # Assert
+        self.assertEqual(actual.alfa, expected.alfa, "alfa not matching")
+        self.assertLessEqual(warm_calls, 3, "too many evaluations of big_g")
+        self.assertLess(warm_calls, cold_calls, "no fewer evaluations of big_g")
+
+    def test_smith_wilson_cache(self):
+        """Test of the calibration cache"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        other = {1: 0.011, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        cache = solvency2_data.LRUCache(maxsize=1)
+
+        # Expected output
+        expected = solvency2_data.smith_wilson("Zero", liqmat, rates, 1, 0, 0.036)
+
+        # Actual output
+        first = solvency2_data.smith_wilson(
+            "Zero", liqmat, rates, 1, 0, 0.036, cache=cache
+        )
+        second = solvency2_data.smith_wilson(
+            "Zero", liqmat, dict(reversed(rates.items())), 1, 0, 0.036, cache=cache
+        )
+        solvency2_data.smith_wilson("Zero", liqmat, other, 1, 0, 0.036, cache=cache)
+        solvency2_data.smith_wilson("Zero", liqmat, rates, 1, 0, 0.036, cache=cache)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sw_cache.npz")
+            cache.path = path
+            cache.save()
+            loaded = solvency2_data.LRUCache(maxsize=1, path=path)
+            solvency2_data.smith_wilson(
+                "Zero", liqmat, rates, 1, 0, 0.036, cache=loaded
+            )
+
+        # Assert
+        np.testing.assert_almost_equal(first, expected, decimal=15)
+        np.testing.assert_almost_equal(second, expected, decimal=15)
+        self.assertEqual(tuple(cache.cache_info()), (1, 3, 1, 1))
+        self.assertEqual(tuple(loaded.cache_info()), (1, 0, 1, 1))
+
+    def test_smith_wilson_cache_curves(self):
+        """Test of cached curves being copied and saved without pickle"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        cache = solvency2_data.LRUCache(maxsize=2)
+
+        # Expected output
+        expected = solvency2_data.SmithWilsonCurve.calibrate(
+            "Zero", liqmat, rates, ufr=0.036
+        )
+
+        # Actual output
+        first = solvency2_data.SmithWilsonCurve.calibrate(
+            "Zero", liqmat, rates, ufr=0.036, cache=cache
+        )
+        first.gamma[:] = 0
+        second = solvency2_data.SmithWilsonCurve.calibrate(
+            "Zero", liqmat, rates, ufr=0.036, cache=cache
+        )
+        second.alfa = 0
+        cache.put(("frame", 1), pd.DataFrame({"a": [1.0, 2.0]}, index=["x", "y"]))
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sw_cache.npz")
+            with self.assertRaises(ValueError):
+                cache.save()
+            cache.path = path
+            cache.save()
+            with np.load(path, allow_pickle=False) as arrays:
+                names = sorted(arrays.files)
+            loaded = solvency2_data.LRUCache(maxsize=2, path=path)
+            cached = solvency2_data.SmithWilsonCurve.calibrate(
+                "Zero", liqmat, rates, ufr=0.036, cache=loaded
+            )
+            frame = loaded.get(("frame", 1))
+            cache.put("other", object())
+            with self.assertRaises(TypeError):
+                cache.save()
+
+        # Assert
+        self.assertIn("entries", names)
+        self.assertEqual(tuple(loaded.cache_info()), (2, 0, 2, 2))
+        for curve in [second, cached]:
+            self.assertIsInstance(curve, solvency2_data.SmithWilsonCurve)
+            np.testing.assert_array_equal(curve.gamma, expected.gamma)
+            np.testing.assert_array_equal(curve.maturities, expected.maturities)
+        self.assertEqual(cached.alfa, expected.alfa)
+        np.testing.assert_array_equal(
+            cached.zero_rates(np.arange(0, 121)), expected.zero_rates(np.arange(0, 121))
+        )
+        pd.testing.assert_frame_equal(
+            frame, pd.DataFrame({"a": [1.0, 2.0]}, index=["x", "y"])
+        )
+
+    def test_smith_wilson_output_grid(self):
+        """Test of configurable output maturities"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        ufr = 0.036
+
+        # Expected output
+        expected = solvency2_data.smith_wilson(
+            "Zero", liqmat, rates, 1, 0, ufr, output_type="all"
+        )
+        curve = solvency2_data.SmithWilsonCurve.calibrate(
+            "Zero", liqmat, rates, 1, 0, ufr
+        )
+
+        # Actual output
+        monthly = solvency2_data.smith_wilson(
+            "Zero",
+            liqmat,
+            rates,
+            1,
+            0,
+            ufr,
+            output_type="all",
+            max_maturity=150,
+            step=1 / 12,
+        )
+        explicit = solvency2_data.smith_wilson(
+            "Zero",
+            liqmat,
+            rates,
+            1,
+            0,
+            ufr,
+            output_type="discount rates",
+            maturities=[0, 0.5, 30, 200],
+        )
+        batch = solvency2_data.smith_wilson_batch(
+            liqmat, [list(rates.values())], ufr=ufr, max_maturity=150, step=1 / 12
+        )
+        jacobian = solvency2_data.smith_wilson_jacobian(
+            "Zero", liqmat, rates, 1, 0, ufr, maturities=[0, 0.5, 30, 200]
+        )
+
+        # Assert
+        self.assertEqual(monthly.zero_rates.shape, (150 * 12 + 1,))
+        np.testing.assert_almost_equal(
+            monthly.zero_rates[: 121 * 12 : 12],
+            expected.zero_rates,
+            decimal=12,
+            err_msg="zero rates not matching",
+        )
+        np.testing.assert_almost_equal(
+            monthly.discount_rates,
+            curve.discount_rates(np.arange(0, 150 * 12 + 1) / 12),
+            decimal=12,
+            err_msg="discount rates not matching",
+        )
+        np.testing.assert_almost_equal(
+            np.prod((1 + monthly.forward_rates[12 * 30 + 1 : 12 * 31 + 1]) ** (1 / 12)),
+            1 + expected.forward_rates[31],
+            decimal=12,
+            err_msg="forward rates not matching",
+        )
+        np.testing.assert_almost_equal(
+            explicit,
+            curve.discount_rates(np.array([0, 0.5, 30, 200])),
+            decimal=12,
+            err_msg="explicit maturities not matching",
+        )
+        np.testing.assert_almost_equal(
+            batch[0], monthly.zero_rates, decimal=12, err_msg="batch not matching"
+        )
+        self.assertEqual(jacobian.shape, (4, 5))
+
+    def test_smith_wilson_all(self):
+        """Test that output_type all returns every output of one calibration"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        args = ("Zero", liqmat, rates, 1, 10, 0.036)
+
+        # Actual output
+        actual = solvency2_data.smith_wilson(*args, output_type="all")
+
+        # Assert
+        self.assertIsInstance(actual, solvency2_data.SmithWilsonOutput)
+        for field, output_type in [
+            ("zero_rates", "zero rates annual compounding"),
+            ("forward_rates", "forward rate annual compounding"),
+            ("discount_rates", "discount rates"),
+            ("forward_intensities", "forward intensities"),
+            ("yield_intensities", "yield intensities"),
+            ("alfa", "alfa"),
+        ]:
+            np.testing.assert_array_equal(
+                getattr(actual, field),
+                solvency2_data.smith_wilson(*args, output_type=output_type),
+                err_msg=field + " not matching",
+            )
+
+    def test_smith_wilson_swaps(self):
+        """Test that a curve calibrated on par swaps reprices the swaps"""
+
+        # Input
+        liqmat = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20]
+        rates = dict(
+            zip(
+                liqmat,
+                [0.0311, 0.0296, 0.029, 0.0288, 0.0289, 0.0291, 0.0293]
+                + [0.0295, 0.0298, 0.03, 0.0304, 0.0308, 0.0309],
+            )
+        )
+        cra = 10
+        nrofcoup = 2
+
+        # Actual output
+        curve = solvency2_data.SmithWilsonCurve.calibrate(
+            "Swap", liqmat, rates, nrofcoup, cra, 0.0345, method="brentq"
+        )
+        for u in liqmat:
+            times = np.arange(1, u * nrofcoup + 1) / nrofcoup
+            payoffs = np.full(times.size, (rates[u] - cra / 10000) / nrofcoup)
+            payoffs[-1] += 1
+            actual = np.sum(payoffs * curve.discount_rates(times))
+
+            # Assert
+            np.testing.assert_almost_equal(
+                actual, 1, decimal=12, err_msg="swap price not matching"
+            )
+
+    def test_smith_wilson_jacobian(self):
+        """Test of the jacobian against central differences at fixed alfa"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        cra = 10
+        ufr = 0.036
+        alfa = solvency2_data.smith_wilson(
+            "Zero", liqmat, rates, 1, cra, ufr, output_type="alfa"
+        )
+        bump = 1e-6
+
+        # Expected output, with a tau for which min_alfa is optimal
+        expected = []
+        for u in liqmat:
+            outputs = []
+            for sign in [1, -1]:
+                bumped = dict(rates)
+                bumped[u] += sign * bump
+                outputs.append(
+                    solvency2_data.smith_wilson(
+                        "Zero", liqmat, bumped, 1, cra, ufr, alfa, tau=1e8
+                    )
+                )
+            expected.append((outputs[0] - outputs[1]) / (2 * bump))
+        expected = np.array(expected).T
+
+        # Actual output
+        actual = solvency2_data.smith_wilson_jacobian(
+            "Zero", liqmat, rates, 1, cra, ufr
+        )
+
+        # Assert
+        self.assertTupleEqual(actual.shape, (121, 5), "Shapes not matching")
+        np.testing.assert_almost_equal(
+            actual, expected, decimal=8, err_msg="jacobian not matching"
+        )
+
+    def test_smith_wilson_jacobian_alfa(self):
+        """Test of the jacobian including alfa against central differences"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10]
+        rates = {1: 0.01, 2: 0.012, 3: 0.014, 5: 0.017, 10: 0.02}
+        cra = 10
+        ufr = 0.036
+        # alfa is rounded to 6 decimals, so the bump moves alfa by far more
+        bump = 1e-4
+
+        # Expected output
+        expected = []
+        expected_alfa = []
+        for u in liqmat:
+            outputs = []
+            alfas = []
+            for sign in [1, -1]:
+                bumped = dict(rates)
+                bumped[u] += sign * bump
+                outputs.append(
+                    solvency2_data.smith_wilson("Zero", liqmat, bumped, 1, cra, ufr)
+                )
+                alfas.append(
+                    solvency2_data.smith_wilson(
+                        "Zero", liqmat, bumped, 1, cra, ufr, output_type="alfa"
+                    )
+                )
+            expected.append((outputs[0] - outputs[1]) / (2 * bump))
+            expected_alfa.append((alfas[0] - alfas[1]) / (2 * bump))
+        expected = np.array(expected).T
+
+        # Actual output
+        actual = solvency2_data.smith_wilson_jacobian(
+            "Zero", liqmat, rates, 1, cra, ufr, include_alfa=True, output_type="all"
+        )
+
+        # Assert
+        self.assertGreater(
+            solvency2_data.smith_wilson(
+                "Zero", liqmat, rates, 1, cra, ufr, output_type="alfa"
+            ),
+            0.05,
+        )
+        np.testing.assert_almost_equal(
+            actual.zero_rates, expected, decimal=3, err_msg="jacobian not matching"
+        )
+        np.testing.assert_allclose(
+            actual.alfa, expected_alfa, rtol=1e-2, err_msg="alfa not matching"
+        )
+
+    def test_smith_wilson_jacobian_min_alfa(self):
+        """Test of the jacobian including alfa if alfa stays at min_alfa"""
+
+        # Input
+        liqmat = [1, 2, 3, 5, 10, 20]
+        curves = [
+            {u: 0.029 + 0.0002 * np.log(u) for u in liqmat},
+            {u: 0.03 for u in liqmat},
+        ]
+        ufr = 0.03
+
+        for rates in curves:
+            # Expected output
+            expected = solvency2_data.smith_wilson_jacobian(
+                "Zero", liqmat, rates, 1, 0, ufr
+            )
+
+            # Actual output
+            alfa = solvency2_data.smith_wilson(
+                "Zero", liqmat, rates, 1, 0, ufr, output_type="alfa"
+            )
+            actual = solvency2_data.smith_wilson_jacobian(
+                "Zero", liqmat, rates, 1, 0, ufr, include_alfa=True, output_type="all"
+            )
+
+            # Assert
+            self.assertEqual(alfa, 0.05)
+            np.testing.assert_array_equal(actual.alfa, np.zeros(len(liqmat)))
+            np.testing.assert_array_equal(actual.zero_rates, expected)
+
 
 if __name__ == "__main__":
     unittest.main()